@@ -0,0 +1,162 @@
+"""Headless self-play arena: play engine configurations against each other.
+
+Every pair of engines plays each ordered god pairing from create_god,
+once on each side of the board with the same starting placement. Games run
+in parallel on a process pool and each finished game is appended to a JSON
+lines file, so a long run can be inspected (or re-reported) while it plays:
+
+    python arena.py --engine "d2:depth=2" --engine "d3:depth=3" --games 1
+    python arena.py --engine "ab:time=300" --engine "mcts:type=mcts,time=300" --workers 8
+    python arena.py --report arena_results.jsonl
+
+Engine options (comma separated after "name:"):
+    type        minimax (alpha-beta, default) or mcts
+    depth       fixed search depth (alpha-beta without a time budget)
+    time        time budget per move in milliseconds
+    iterations  MCTS iteration budget (instead of time)
+    workers     processes for root-parallel alpha-beta (0 = off); pair with --workers 1
+                to measure depth against cores
+    height      per-level height scores, e.g. 0/10/30/1000
+    mobility    evaluation weight per legal move
+    builds      evaluation weight per buildable neighbour
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from santorini.gods import GOD_NAMES, create_god
+from santorini.selfplay import MAX_PLIES, parse_engine, play_game
+
+DEFAULT_OUTPUT = "arena_results.jsonl"
+
+def schedule(configs, gods, games, seed):
+    """(configs, gods, seed) for every game: each engine pair, god pairing and side"""
+    jobs = []
+    rng = random.Random(seed)
+    for first, second in itertools.combinations(configs, 2):
+        for god_pair in itertools.permutations(gods, 2):
+            for _ in range(games):
+                game_seed = rng.getrandbits(32)
+                # Same placement and gods with the engines swapped, so neither side is favoured
+                jobs.append(((first, second), god_pair, game_seed))
+                jobs.append(((second, first), god_pair, game_seed))
+    return jobs
+
+def elo_ratings(results, iterations=200):
+    """Elo estimates {engine: rating} fitted to all games, the first engine anchored at 0.
+
+    Every engine gets one virtual draw against an opponent rated at the pool mean, so a perfect
+    score still has a finite best fit.
+    """
+    names = []
+    for record in results:
+        for name in record["engines"]:
+            if name not in names:
+                names.append(name)
+    ratings = {name: 0.0 for name in names}
+
+    for _ in range(iterations):
+        mean = sum(ratings.values()) / len(ratings)
+        for name in names:
+            # The virtual draw against the pool mean
+            actual, expected, count = 0.5, 1.0 / (1.0 + 10 ** ((mean - ratings[name]) / 400.0)), 1
+            for record in results:
+                if name not in record["engines"]:
+                    continue
+                side = record["engines"].index(name)
+                opponent = ratings[record["engines"][1 - side]]
+                expected += 1.0 / (1.0 + 10 ** ((opponent - ratings[name]) / 400.0))
+                actual += 0.5 if record["winner"] is None else float(record["winner"] == side)
+                count += 1
+            ratings[name] += 400.0 * (actual - expected) / count
+        anchor = ratings[names[0]]
+        for name in names:
+            ratings[name] -= anchor
+    return ratings
+
+def report(results):
+    """Print win rates, Elo estimates and think time per engine"""
+    stats = {}
+    for record in results:
+        for side, name in enumerate(record["engines"]):
+            entry = stats.setdefault(name, {"games": 0, "wins": 0, "draws": 0, "think_ms": 0.0, "moves": 0,
+                                            "depth": 0.0})
+            entry["games"] += 1
+            if record["winner"] is None:
+                entry["draws"] += 1
+            elif record["winner"] == side:
+                entry["wins"] += 1
+            entry["think_ms"] += record["think_ms"][side]
+            entry["moves"] += record["moves"][side]
+            entry["depth"] += record.get("depth", [0.0, 0.0])[side] * record["moves"][side]
+
+    ratings = elo_ratings(results)
+    print(f"{'engine':<16}{'games':>7}{'wins':>7}{'draws':>7}{'win %':>8}{'elo':>8}{'ms/move':>10}{'depth':>7}")
+    for name, entry in sorted(stats.items(), key=lambda item: -ratings[item[0]]):
+        score = (entry["wins"] + 0.5 * entry["draws"]) / entry["games"]
+        ms_per_move = entry["think_ms"] / entry["moves"] if entry["moves"] else 0.0
+        depth = entry["depth"] / entry["moves"] if entry["moves"] else 0.0
+        print(f"{name:<16}{entry['games']:>7}{entry['wins']:>7}{entry['draws']:>7}"
+              f"{score * 100:>7.1f}%{ratings[name]:>+8.0f}{ms_per_move:>10.1f}{depth:>7.2f}")
+
+def run(configs, gods, games, workers, output, seed, max_plies=MAX_PLIES):
+    """Play the whole schedule on a process pool, appending each result to `output` as it finishes"""
+    jobs = schedule(configs, gods, games, seed)
+    results = []
+    start = time.time()
+    with open(output, "a") as f, ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(play_game, pair, god_pair, game_seed, max_plies)
+                   for pair, god_pair, game_seed in jobs]
+        for future in as_completed(futures):
+            record = future.result()
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            results.append(record)
+            print(f"{len(results)}/{len(jobs)} {record['engines'][0]} ({record['gods'][0]}) vs "
+                  f"{record['engines'][1]} ({record['gods'][1]}): winner {record['winner']} "
+                  f"({time.time() - start:.0f}s)")
+    return results
+
+def load_results(path):
+    """Game records from a results file written by run()"""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless self-play arena with Elo reports")
+    parser.add_argument("--engine", action="append", default=[], metavar="SPEC",
+                        help='engine config "name:key=value,..." (give at least two)')
+    parser.add_argument("--gods", default=",".join(GOD_NAMES), help="comma separated gods to pair up")
+    parser.add_argument("--games", type=int, default=1, help="games per engine pair, god pairing and side")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="parallel games")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON lines file results are appended to")
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES, help="actions before a game is drawn")
+    parser.add_argument("--seed", type=int, default=0, help="seed for placements and evaluation noise")
+    parser.add_argument("--report", metavar="FILE", help="only print the report for an existing results file")
+    args = parser.parse_args()
+
+    if args.report:
+        report(load_results(args.report))
+        return
+
+    configs = [parse_engine(spec) for spec in args.engine]
+    if len(configs) < 2:
+        parser.error("give at least two --engine configs")
+    if len({config["name"] for config in configs}) != len(configs):
+        parser.error("engine names must be unique")
+    gods = [name.strip() for name in args.gods.split(",") if name.strip()]
+    for name in gods:
+        if create_god(name) is None:
+            parser.error(f"unknown god: {name}")
+
+    results = run(configs, gods, args.games, args.workers, args.output, args.seed, args.max_plies)
+    print()
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,37 @@
 import arcade
 import os
 import math
+from PIL import Image
+
+# Baked building textures by (tile size, level), shared by every view until the process exits
+_building_textures = {}
+
+def bake_texture(size, draw_fn, hash):
+    """Render draw_fn() once into a `size` pixels square texture (transparent where nothing is drawn)"""
+    window = arcade.get_window()
+    ctx = window.ctx
+    
+    # Draw with the window's multisampling so edges match immediate-mode drawing
+    samples = window.config.samples or 0
+    multisampled = ctx.framebuffer(color_attachments=[ctx.texture((size, size), components=4, samples=samples)])
+    camera = arcade.camera.Camera2D(viewport=arcade.LBWH(0, 0, size, size), render_target=multisampled)
+    with camera.activate():
+        multisampled.clear(color=(0, 0, 0, 0))
+        draw_fn()
+    framebuffer = ctx.framebuffer(color_attachments=[ctx.texture((size, size), components=4)])
+    ctx.copy_framebuffer(multisampled, framebuffer)
+    
+    # Framebuffer rows start at the bottom
+    image = Image.frombytes("RGBA", (size, size), framebuffer.read(components=4))
+    image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    
+    # The pixels now live in the image: free the render targets
+    for target in (multisampled, framebuffer):
+        for attachment in target.color_attachments:
+            attachment.delete()
+        target.delete()
+    
+    return arcade.Texture(image, hash=hash, hit_box_algorithm=arcade.hitbox.algo_bounding_box)
 
 class BoardView:
     def __init__(self, game, tile_size, offset_x, offset_y, margin=4):
@@ -34,6 +65,14 @@ class BoardView:
         # Building dimensions
         self.base_building_size = 0.7  # Fraction of tile size for building base
         self.floor_height = 8  # Height of each floor in pixels
+        
+        # Ground tiles never change: batch them once, drawn with a single call
+        self.ground_layer = None
+        
+        # Buildings: one baked texture per height, one sprite per cell (built on the first frame)
+        self.building_textures = None  # level -> texture (1-4)
+        self.building_sprites = None  # SpriteList of 25 sprites, square = row * 5 + col
+        self.building_levels = [0] * 25  # Level each sprite currently shows
     
     def cell_to_center(self, cell):
         """Convert grid cell (col, row) to pixel center coordinates with margin"""
@@ -236,35 +275,77 @@ class BoardView:
             self.building_highlight, 2
         )
     
-    def draw_ground_tile(self, left, bottom, right, top):
-        """Draw the ground tile with a subtle texture"""
+    def add_ground_tile(self, shapes, left, bottom, right, top):
+        """Add a ground tile with a subtle border to a shape batch"""
+        center_x = (left + right) / 2
+        center_y = (bottom + top) / 2
+        width = right - left - 4
+        height = top - bottom - 4
+        
         # Base ground color
-        arcade.draw_lrbt_rectangle_filled(
-            left + 2, right - 2, bottom + 2, top - 2,
-            self.ground_color
-        )
+        shapes.append(arcade.shape_list.create_rectangle_filled(
+            center_x, center_y, width, height, self.ground_color
+        ))
         
         # Subtle border
-        arcade.draw_lrbt_rectangle_outline(
-            left + 2, right - 2, bottom + 2, top - 2,
-            (120, 160, 90), 1
-        )
+        shapes.append(arcade.shape_list.create_rectangle_outline(
+            center_x, center_y, width, height, (120, 160, 90), 1
+        ))
+    
+    def build_ground_layer(self):
+        """Batch all 25 ground tiles into one shape list"""
+        self.ground_layer = arcade.shape_list.ShapeElementList()
+        for row in range(5):
+            for col in range(5):
+                left, bottom, right, top = self.cell_to_bounds((col, row))
+                self.add_ground_tile(self.ground_layer, left, bottom, right, top)
+    
+    def bake_building_texture(self, level):
+        """Render a building of `level` floors once per process into a texture (centred, transparent around it)"""
+        key = (self.tile_size, level)
+        if key in _building_textures:
+            return _building_textures[key]
+        
+        # Two tiles square leaves room for the dome and finial above a level 4 building
+        size = self.tile_size * 2
+        _building_textures[key] = bake_texture(size, lambda: self.draw_greek_building(size // 2, size // 2, level),
+                                               f"building-{self.tile_size}-{level}")
+        return _building_textures[key]
+    
+    def build_building_sprites(self):
+        """Place one (hidden) sprite on every cell, with the four building textures baked on first use"""
+        self.building_textures = {level: self.bake_building_texture(level) for level in range(1, 5)}
+        self.building_sprites = arcade.SpriteList()
+        for square in range(25):
+            sprite = arcade.Sprite(self.building_textures[1])
+            sprite.center_x, sprite.center_y = self.cell_to_center((square % 5, square // 5))
+            sprite.visible = False
+            self.building_sprites.append(sprite)
+        self.building_levels = [0] * 25
+    
+    def update_buildings(self):
+        """Point the sprites of cells whose height changed at the matching texture"""
+        board = self.game.board
+        for square in range(25):
+            level = board[square // 5][square % 5]
+            if level != self.building_levels[square]:
+                sprite = self.building_sprites[square]
+                if level > 0:
+                    sprite.texture = self.building_textures[level]
+                sprite.visible = level > 0
+                self.building_levels[square] = level
     
     def draw(self):
         # Draw background if available
         if len(self.background_sprite_list) > 0:
             self.background_sprite_list.draw()
         
-        # Draw buildings and ground tiles
-        for row in range(5):
-            for col in range(5):
-                left, bottom, right, top = self.cell_to_bounds((col, row))
-                level = self.game.board[row][col]
-                center_x, center_y = self.cell_to_center((col, row))
-                
-                # Always draw ground tile
-                self.draw_ground_tile(left, bottom, right, top)
-                
-                # Draw building if level > 0
-                if level > 0:
-                    self.draw_greek_building(center_x, center_y, level)
+        # Static layers (built on the first frame, when a GL context exists)
+        if self.ground_layer is None:
+            self.build_ground_layer()
+            self.build_building_sprites()
+        self.ground_layer.draw()
+        
+        # Buildings on top of the ground, one sprite per cell
+        self.update_buildings()
+        self.building_sprites.draw(pixelated=True)
@@ -0,0 +1,198 @@
+"""Engine benchmark suite: hot-function timings, search speed and memory.
+
+Runs on a fixed corpus of opening, midgame and endgame positions with every
+god from create_god on each side. Reports micro-benchmarks for
+Santorini.all_actions, clone, do_action, AIPlayer.evaluate and minimax,
+alpha-beta nodes per second, time to reach each depth and peak memory.
+Results are JSON; --compare flags regressions against a stored baseline:
+
+    python benchmark.py --output baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.10
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from santorini.gameplay import AIPlayer, TranspositionTable
+from santorini.selfplay import load_position
+
+# (phase, player 0 god, player 1 god, heights by square, worker squares, side to move)
+# Square = row * 5 + col; workers in Santorini.workers order (player 0 first)
+CORPUS = [
+    ("opening", "Pan", "Atlas", "0000000000000000000000000", (4, 18, 24, 2), 0),
+    ("midgame", "Pan", "Atlas", "0001020010002110100000100", (10, 17, 7, 2), 0),
+    ("endgame", "Pan", "Atlas", "0030034030110010010121100", (16, 18, 15, 7), 0),
+    ("opening", "Atlas", "Artemis", "0000000000000000000000000", (18, 6, 17, 11), 0),
+    ("midgame", "Atlas", "Artemis", "0000000010101110100100300", (16, 10, 18, 9), 0),
+    ("endgame", "Atlas", "Artemis", "1010011201013100020301121", (6, 10, 20, 22), 0),
+    ("opening", "Artemis", "Demeter", "0000000000000000000000000", (2, 22, 10, 13), 0),
+    ("midgame", "Artemis", "Demeter", "0010000010000100011012110", (16, 18, 12, 17), 0),
+    ("endgame", "Artemis", "Demeter", "0202001011114011120102001", (16, 8, 18, 6), 0),
+    ("opening", "Demeter", "Athena", "0000000000000000000000000", (12, 20, 15, 17), 0),
+    ("midgame", "Demeter", "Athena", "0110001000000010033000000", (14, 22, 7, 12), 0),
+    ("endgame", "Demeter", "Athena", "2204112110000210101200001", (17, 1, 9, 24), 0),
+    ("opening", "Athena", "Poseidon", "0000000000000000000000000", (15, 3, 13, 8), 0),
+    ("midgame", "Athena", "Poseidon", "1100201000010011010100000", (16, 5, 20, 8), 0),
+    ("endgame", "Athena", "Poseidon", "2101000230310400000112010", (11, 16, 5, 17), 0),
+    ("opening", "Poseidon", "Pan", "0000000000000000000000000", (20, 9, 11, 7), 0),
+    ("midgame", "Poseidon", "Pan", "0000101100000131000100010", (11, 3, 2, 18), 0),
+    ("endgame", "Poseidon", "Pan", "0121200110113031002000300", (17, 19, 13, 7), 0),
+]
+
+# Metrics where a larger value is better (everything else is a time or a size)
+HIGHER_IS_BETTER = {"nodes_per_sec"}
+
+def build_position(entry):
+    """Santorini game for a corpus entry (gods in their initial state)"""
+    _, god0, god1, heights, squares, turn = entry
+    return load_position((god0, god1), heights, squares, turn)
+
+def time_call(function, number, repeat=5):
+    """Best time per call in microseconds over `repeat` runs of `number` calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+def micro_benchmarks(games, number):
+    """Microseconds per call of each hot function, averaged over the corpus"""
+    totals = {"all_actions": 0.0, "clone": 0.0, "do_action": 0.0, "evaluate": 0.0, "minimax_depth1": 0.0}
+    for game in games:
+        ai = AIPlayer(game.turn, god_manager=game.god_manager)
+        god_state = game.god_manager.get_state()
+        action = game.all_actions(game.turn)[0]
+        totals["all_actions"] += time_call(lambda: game.all_actions(game.turn), number)
+        totals["clone"] += time_call(game.clone, number)
+        totals["evaluate"] += time_call(lambda: ai.evaluate(game), number)
+        totals["minimax_depth1"] += time_call(lambda: ai.minimax(game, 1, True), max(1, number // 50))
+        game.god_manager.set_state(god_state)  # minimax plays on clones that share the gods
+
+        # do_action changes the game and its gods: play it on fresh clones, restore the god state after
+        best = float('inf')
+        for _ in range(5):
+            copies = [game.clone() for _ in range(number)]
+            start = time.perf_counter()
+            for copy in copies:
+                copy.do_action(*action)
+            best = min(best, time.perf_counter() - start)
+            game.god_manager.set_state(god_state)
+        totals["do_action"] += best / number * 1e6
+    return {name: round(total / len(games), 3) for name, total in totals.items()}
+
+def search_benchmarks(games, depth):
+    """Alpha-beta nodes per second, cumulative time to complete each depth and peak traced memory"""
+    nodes = 0
+    seconds = 0.0
+    time_to_depth = [0.0] * depth
+    peak = 0
+    for game in games:
+        god_state = game.god_manager.get_state()
+        game.track_eval_terms()
+
+        # Timed run: iterative deepening by hand so every depth gets its own timestamp
+        ai = AIPlayer(game.turn, god_manager=game.god_manager)
+        ai.tt = TranspositionTable(ai.tt_size_bits)
+        start = time.perf_counter()
+        for d in range(1, depth + 1):
+            ai.tt.new_search()
+            ai.search(game, d)
+            time_to_depth[d - 1] += time.perf_counter() - start
+        seconds += time.perf_counter() - start
+        nodes += ai.nodes
+        game.god_manager.set_state(god_state)
+
+        # Traced run (tracemalloc slows everything down, so it is not timed)
+        ai = AIPlayer(game.turn, god_manager=game.god_manager)
+        tracemalloc.start()
+        ai.tt = TranspositionTable(ai.tt_size_bits)
+        for d in range(1, depth + 1):
+            ai.tt.new_search()
+            ai.search(game, d)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        game.eval_terms = None
+        game.god_manager.set_state(god_state)
+
+    return {
+        "nodes": nodes,
+        "nodes_per_sec": round(nodes / seconds),
+        "time_to_depth_ms": {str(d + 1): round(t / len(games) * 1000, 3) for d, t in enumerate(time_to_depth)},
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+def run(depth, number, seed):
+    """All benchmarks on the corpus, as a JSON-ready dict"""
+    random.seed(seed)  # Evaluation noise changes the node counts
+    games = [build_position(entry) for entry in CORPUS]
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": len(CORPUS),
+        "depth": depth,
+        "micro_us": micro_benchmarks(games, number),
+        "search": search_benchmarks(games, depth),
+    }
+
+def flatten(results):
+    """{metric path: value} for every number compared between runs"""
+    metrics = {f"micro_us.{name}": value for name, value in results["micro_us"].items()}
+    search = results["search"]
+    metrics["search.nodes_per_sec"] = search["nodes_per_sec"]
+    metrics["search.peak_memory_kb"] = search["peak_memory_kb"]
+    for d, ms in search["time_to_depth_ms"].items():
+        metrics[f"search.time_to_depth_ms.{d}"] = ms
+    return metrics
+
+def compare(results, baseline, threshold):
+    """Print every metric against the baseline; returns the names of the regressed ones"""
+    current, previous = flatten(results), flatten(baseline)
+    regressions = []
+    print(f"{'metric':<34}{'baseline':>14}{'current':>14}{'change':>9}")
+    for name, value in current.items():
+        if name not in previous or not previous[name]:
+            continue
+        change = (value - previous[name]) / previous[name]
+        worse = -change if name.rsplit(".", 1)[-1] in HIGHER_IS_BETTER else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<34}{previous[name]:>14}{value:>14}{change * 100:>+8.1f}%{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Santorini engine")
+    parser.add_argument("--depth", type=int, default=3, help="deepest search for time-to-depth")
+    parser.add_argument("--number", type=int, default=200, help="calls per micro-benchmark run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the evaluation noise")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    results = run(args.depth, args.number, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print("No regressions")
+    elif not args.output:
+        print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
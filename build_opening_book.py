@@ -0,0 +1,94 @@
+"""Build the placement opening book used by Santorini.ai_placement_move.
+
+The human places both workers first, then the AI places two. For every AI
+placement position (up to the 8 board symmetries) this searches each free
+square and records the best one. The search runs without evaluation noise
+and without gods, so the book holds the same moves on every run and is
+recorded as built for the no-god matchup:
+
+    python build_opening_book.py --depth 3
+"""
+import argparse
+import itertools
+import json
+import time
+
+from santorini.gameplay import AIPlayer, OPENING_BOOK_PATH, Santorini, placement_key
+
+def position_from_key(key):
+    """Santorini game with workers placed as in a placement key"""
+    game = Santorini()
+    human = [square for square, cell in enumerate(key) if cell == 'h']
+    ai = [square for square, cell in enumerate(key) if cell == 'a']
+    for index, square in enumerate(human + ai):
+        worker_index = index if index < len(human) else 2 + index - len(human)
+        game.place_worker_at(worker_index, square % 5, square // 5)
+    game.turn = 1  # The AI moves first after placing the last worker
+    return game
+
+def with_worker(key, square, cell):
+    """Key with a worker added on `square`"""
+    return key[:square] + cell + key[square + 1:]
+
+def canonical_positions(humans, ais):
+    """All canonical keys with the given number of human and AI workers"""
+    keys = set()
+    for squares in itertools.combinations(range(25), humans + ais):
+        for ai_squares in itertools.combinations(squares, ais):
+            cells = ['.'] * 25
+            for square in squares:
+                cells[square] = 'a' if square in ai_squares else 'h'
+            keys.add(placement_key(''.join(cells))[0])
+    return sorted(keys)
+
+def build_book(depth, verbose=True):
+    """Search every AI placement position, returns {canonical key: best square}"""
+    ai = AIPlayer(player_id=1, depth=depth, eval_noise=False)
+    book = {}
+    values = {}
+    
+    # Second AI worker: search the full position after each candidate square
+    positions = canonical_positions(2, 1)
+    start = time.time()
+    for i, key in enumerate(positions):
+        best_square, best_score = None, float('-inf')
+        for square in range(25):
+            if key[square] != '.':
+                continue
+            game = position_from_key(with_worker(key, square, 'a'))
+            ai.tt = None
+            score, _ = ai.alphabeta(game, depth, float('-inf'), float('inf'), True)
+            if score > best_score:
+                best_square, best_score = square, score
+        book[key] = best_square
+        values[key] = best_score
+        if verbose and (i + 1) % 50 == 0:
+            print(f"{i + 1}/{len(positions)} positions ({time.time() - start:.0f}s)")
+    
+    # First AI worker: pick the square whose best follow-up scores highest
+    for key in canonical_positions(2, 0):
+        best_square, best_score = None, float('-inf')
+        for square in range(25):
+            if key[square] != '.':
+                continue
+            score = values[placement_key(with_worker(key, square, 'a'))[0]]
+            if score > best_score:
+                best_square, best_score = square, score
+        book[key] = best_square
+    return book
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the placement opening book")
+    parser.add_argument("--depth", type=int, default=3, help="search depth after placement")
+    parser.add_argument("--output", default=OPENING_BOOK_PATH, help="book file to write")
+    args = parser.parse_args()
+    
+    book = build_book(args.depth)
+    with open(args.output, "w") as f:
+        # Gods by player (human, AI): the book was searched with no god powers
+        json.dump({"depth": args.depth, "gods": [None, None], "positions": book}, f,
+                  separators=(",", ":"), sort_keys=True)
+    print(f"Wrote {len(book)} positions to {args.output}")
+
+if __name__ == "__main__":
+    main()
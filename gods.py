@@ -1,32 +1,64 @@
 import arcade
 import os
-from abc import ABC, abstractmethod
+from PIL import Image
 
-class GodPower(ABC):
-    """Base class for all God Powers"""
+from santorini.gods import GOD_NAMES, create_god
+
+# Decoded card textures by (image path, scale), shared by every view until the process exits
+_card_textures = {}
+
+def load_card_texture(image_path, scale):
+    """Card image resized to `scale` as a texture, decoded once per process (None if it's missing)"""
+    key = (image_path, scale)
+    if key not in _card_textures:
+        texture = None
+        if os.path.exists(image_path):
+            image = Image.open(image_path).convert("RGBA")
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            # Cards are rectangles: a bounding box hit box skips tracing the image outline
+            texture = arcade.Texture(image.resize(size, Image.Resampling.LANCZOS), hash=f"{image_path}@{scale}",
+                                     hit_box_algorithm=arcade.hitbox.algo_bounding_box)
+        else:
+            print(f"Warning: Could not find god card image: {image_path}")
+        _card_textures[key] = texture
+    return _card_textures[key]
+
+# Laid-out text by (string, size, colour, anchors, style), reused by every draw path
+_texts = {}
+
+def draw_cached_text(string, x, y, color, font_size, anchor_x="left", anchor_y="baseline",
+                     bold=False, width=None, multiline=False):
+    """Like arcade.draw_text, but each distinct text is laid out once and only moved afterwards"""
+    key = (string, font_size, color, anchor_x, anchor_y, bold, width, multiline)
+    text = _texts.get(key)
+    if text is None:
+        text = arcade.Text(string, x, y, color, font_size, width=width, bold=bold,
+                           anchor_x=anchor_x, anchor_y=anchor_y, multiline=multiline)
+        _texts[key] = text
+    elif text.position != (x, y):
+        text.position = (x, y)
+    text.draw()
+
+class GodCard:
+    """Card sprite for a god power (the rules live in santorini.gods)"""
     # Class variables for consistent dimensions (set by GodSelectionView)
     CARD_WIDTH = 180
     CARD_HEIGHT = 240
     
-    def __init__(self, name, description, image_path):
-        self.name = name
-        self.description = description
-        self.image_path = image_path
+    def __init__(self, god):
+        self.god = god
         self.sprite = None
         self.sprite_list = None
         self.center_x = 0
         self.center_y = 0
-        self.scale = 1.0
-        self.is_active = False
         
     def load_sprite(self, scale=1.0):
-        """Load the god card sprite"""
-        if os.path.exists(self.image_path):
-            self.sprite = arcade.Sprite(self.image_path, scale)
+        """Load the god card sprite (the texture comes from the shared cache)"""
+        texture = load_card_texture(self.god.image_path, scale)
+        if texture is not None:
+            self.sprite = arcade.Sprite(texture)
             self.sprite_list = arcade.SpriteList()
             self.sprite_list.append(self.sprite)
-        else:
-            print(f"Warning: Could not find god card image: {self.image_path}")
         
     def draw(self):
         """Draw the god card"""
@@ -44,248 +76,6 @@ class GodPower(ABC):
         # Use class variables that are automatically set by GodSelectionView
         return (self.center_x - self.CARD_WIDTH/2 <= x <= self.center_x + self.CARD_WIDTH/2 and
                 self.center_y - self.CARD_HEIGHT/2 <= y <= self.center_y + self.CARD_HEIGHT/2)
-        
-    @abstractmethod
-    def can_move(self, game, worker, target_pos):
-        """Override movement rules"""
-        return True
-        
-    @abstractmethod
-    def can_build(self, game, worker, target_pos):
-        """Override building rules"""
-        return True
-        
-    @abstractmethod
-    def on_move(self, game, worker, old_pos, new_pos):
-        """Triggered after a move"""
-        pass
-        
-    @abstractmethod
-    def on_build(self, game, worker, build_pos):
-        """Triggered after a build"""
-        pass
-        
-    @abstractmethod
-    def has_won(self, game, worker):
-        """Override win conditions"""
-        return False
-
-# God Power Implementations with ACTIVE LOGIC
-
-class Pan(GodPower):
-    """Also wins by jumping down 2 levels"""
-    def __init__(self):
-        super().__init__(
-            "Pan", 
-            "You also win by jumping down 2 levels.",
-            "assets/gods/pan.png"
-        )
-        
-    def can_move(self, game, worker, target_pos):
-        return True  # Normal movement rules
-        
-    def can_build(self, game, worker, target_pos):
-        return True  # Normal building rules
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        # Store previous height for win condition check
-        if old_pos:
-            worker.previous_height = game.board[old_pos[1]][old_pos[0]]
-        
-    def on_build(self, game, worker, build_pos):
-        pass
-        
-    def has_won(self, game, worker):
-        # ACTIVE: Check if worker moved down 2+ levels
-        if hasattr(worker, 'previous_height') and worker.x is not None:
-            current_height = game.board[worker.y][worker.x]
-            if worker.previous_height - current_height >= 2:
-                return True
-        return False
-
-class Atlas(GodPower):
-    """Build domes as if they were blocks"""
-    def __init__(self):
-        super().__init__(
-            "Atlas",
-            "Build domes as if they were blocks.",
-            "assets/gods/atlas.png"
-        )
-        
-    def can_move(self, game, worker, target_pos):
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        # ACTIVE: Can build domes at any level (not just level 3)
-        x, y = target_pos
-        if game.board[y][x] >= 4 or game.occupants[y][x] is not None:
-            return False
-        return True  # Atlas can build domes anywhere
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        pass
-        
-    def on_build(self, game, worker, build_pos):
-        pass
-        
-    def has_won(self, game, worker):
-        return False
-
-class Artemis(GodPower):
-    """May move a builder twice before building"""
-    def __init__(self):
-        super().__init__(
-            "Artemis",
-            "You may move a builder twice before building.",
-            "assets/gods/artemis.png"
-        )
-        self.has_first_move = False
-        self.first_move_from = None
-        self.current_worker = None
-        
-    def can_move(self, game, worker, target_pos):
-        # ACTIVE: Can't return to starting position on second move
-        if (self.has_first_move and 
-            self.current_worker == worker and 
-            target_pos == self.first_move_from):
-            return False
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        return True
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        # ACTIVE: Track double move
-        if not self.has_first_move or self.current_worker != worker:
-            self.first_move_from = old_pos
-            self.has_first_move = True
-            self.current_worker = worker
-        else:
-            # Second move completed
-            self.has_first_move = False
-            self.first_move_from = None
-            self.current_worker = None
-        
-    def on_build(self, game, worker, build_pos):
-        # Reset after building
-        self.has_first_move = False
-        self.first_move_from = None
-        self.current_worker = None
-        
-    def has_won(self, game, worker):
-        return False
-
-class Demeter(GodPower):
-    """Build an additional block on a different space than the first block"""
-    def __init__(self):
-        super().__init__(
-            "Demeter",
-            "Build an additional block on a different space than the first block.",
-            "assets/gods/demeter.png"
-        )
-        self.first_build_pos = None
-        self.can_build_second = False
-        self.current_worker = None
-        
-    def can_move(self, game, worker, target_pos):
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        # ACTIVE: Second build can't be on same space as first
-        if (self.can_build_second and 
-            self.current_worker == worker and 
-            target_pos == self.first_build_pos):
-            return False
-        return True
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        pass
-        
-    def on_build(self, game, worker, build_pos):
-        # ACTIVE: Track double build
-        if not self.can_build_second or self.current_worker != worker:
-            self.first_build_pos = build_pos
-            self.can_build_second = True
-            self.current_worker = worker
-        else:
-            # Second build completed
-            self.can_build_second = False
-            self.first_build_pos = None
-            self.current_worker = None
-            
-    def has_won(self, game, worker):
-        return False
-
-class Athena(GodPower):
-    """After stepping up a level, no other builders may step up a level until your next turn"""
-    def __init__(self):
-        super().__init__(
-            "Athena",
-            "After stepping up a level, no other builders may step up a level until your next turn.",
-            "assets/gods/athena.png"
-        )
-        self.blocked_player = None
-        
-    def can_move(self, game, worker, target_pos):
-        # ACTIVE: Block opponent from moving up if Athena moved up last turn
-        if (self.blocked_player == worker.owner and 
-            worker.x is not None and worker.y is not None):
-            current_height = game.board[worker.y][worker.x]
-            target_height = game.board[target_pos[1]][target_pos[0]]
-            if target_height > current_height:
-                return False  # Blocked by Athena
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        return True
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        # ACTIVE: Check if this worker moved up
-        if old_pos and worker.x is not None:
-            old_height = game.board[old_pos[1]][old_pos[0]]
-            new_height = game.board[new_pos[1]][new_pos[0]]
-            if new_height > old_height:
-                # Block the opponent player
-                self.blocked_player = 1 - worker.owner
-            else:
-                self.blocked_player = None
-        
-    def on_build(self, game, worker, build_pos):
-        pass
-        
-    def has_won(self, game, worker):
-        return False
-
-class Poseidon(GodPower):
-    """At the end of your turn, build up to three blocks neighboring any builder on the ground level that did not move"""
-    def __init__(self):
-        super().__init__(
-            "Poseidon",
-            "At the end of your turn, build up to three blocks neighboring any builder on the ground level that did not move.",
-            "assets/gods/poseidon.png"
-        )
-        self.unmoved_workers = set()
-        
-    def can_move(self, game, worker, target_pos):
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        return True
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        # ACTIVE: Track which workers moved
-        worker_id = (worker.owner, worker.worker_id)
-        if worker_id in self.unmoved_workers:
-            self.unmoved_workers.remove(worker_id)
-        
-    def on_build(self, game, worker, build_pos):
-        # ACTIVE: Poseidon's extra builds (simplified for now)
-        # In a full implementation, this would allow up to 3 extra builds
-        # near unmoved ground-level workers
-        pass
-        
-    def has_won(self, game, worker):
-        return False
 
 class GodSelectionView:
     """Handles the God Power selection screen with clean uniform layout"""
@@ -293,11 +83,8 @@ class GodSelectionView:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Available gods
-        self.available_gods = [
-            Pan(), Atlas(), Artemis(), 
-            Demeter(), Athena(), Poseidon()
-        ]
+        # Available gods (cards; card.god holds the rules)
+        self.available_gods = [GodCard(create_god(name)) for name in GOD_NAMES]
         
         # UNIFORM CARD DIMENSIONS - Change these to resize all cards
         self.card_width = 160    # Change this value to resize card frames
@@ -305,8 +92,8 @@ class GodSelectionView:
         self.card_scale = 0.22   # Change this value to resize sprite images
         
         # Set class variables for consistent collision detection
-        GodPower.CARD_WIDTH = self.card_width
-        GodPower.CARD_HEIGHT = self.card_height
+        GodCard.CARD_WIDTH = self.card_width
+        GodCard.CARD_HEIGHT = self.card_height
         
         # Load sprites for all gods with uniform scale
         for god in self.available_gods:
@@ -400,8 +187,8 @@ class GodSelectionView:
                         arcade.color.RED, 8
                     )
                     # Selection label below card
-                    arcade.draw_text("HUMAN", god.center_x, god.center_y - self.card_height//2 - 35,
-                                   arcade.color.RED, 18, anchor_x="center", bold=True)
+                    draw_cached_text("HUMAN", god.center_x, god.center_y - self.card_height//2 - 35,
+                                     arcade.color.RED, 18, anchor_x="center", bold=True)
                 elif god == self.ai_selected:
                     arcade.draw_lrbt_rectangle_outline(
                         god.center_x - self.card_width//2 - 5,
@@ -411,8 +198,8 @@ class GodSelectionView:
                         arcade.color.BLUE, 8
                     )
                     # Selection label below card
-                    arcade.draw_text("AI", god.center_x, god.center_y - self.card_height//2 - 35,
-                                   arcade.color.BLUE, 18, anchor_x="center", bold=True)
+                    draw_cached_text("AI", god.center_x, god.center_y - self.card_height//2 - 35,
+                                     arcade.color.BLUE, 18, anchor_x="center", bold=True)
         
         # Draw UI text
         self.title_text.draw()
@@ -424,118 +211,53 @@ class GodSelectionView:
             button_y = 70
             arcade.draw_lrbt_rectangle_filled(button_x - 130, button_x + 130, button_y - 35, button_y + 35,
                                             arcade.color.GREEN)
-            arcade.draw_text("START GAME", button_x, button_y, arcade.color.WHITE, 22,
-                           anchor_x="center", anchor_y="center", bold=True)
+            draw_cached_text("START GAME", button_x, button_y, arcade.color.WHITE, 22,
+                             anchor_x="center", anchor_y="center", bold=True)
 
 class InGameGodDisplay:
     """Handles displaying god powers during gameplay"""
     def __init__(self, human_god, ai_god):
-        self.human_god = human_god
-        self.ai_god = ai_god
+        self.human_card = GodCard(human_god) if human_god else None
+        self.ai_card = GodCard(ai_god) if ai_god else None
         
         # Load smaller sprites for in-game display
-        if self.human_god:
-            self.human_god.load_sprite(scale=0.12)
-        if self.ai_god:
-            self.ai_god.load_sprite(scale=0.12)
+        if self.human_card:
+            self.human_card.load_sprite(scale=0.12)
+        if self.ai_card:
+            self.ai_card.load_sprite(scale=0.12)
             
     def draw(self, screen_width, screen_height, current_turn):
         """Draw god power cards during gameplay"""
         # Human god card (bottom left)
-        if self.human_god and self.human_god.sprite:
-            self.human_god.center_x = 70
-            self.human_god.center_y = 70
+        if self.human_card and self.human_card.sprite:
+            self.human_card.center_x = 70
+            self.human_card.center_y = 70
             
             # Highlight if it's human's turn
             if current_turn == 0:
                 arcade.draw_circle_outline(70, 70, 45, arcade.color.RED, 3)
             
-            self.human_god.draw()
-            arcade.draw_text("HUMAN", 70, 20, arcade.color.RED, 10, anchor_x="center", bold=True)
+            self.human_card.draw()
+            draw_cached_text("HUMAN", 70, 20, arcade.color.RED, 10, anchor_x="center", bold=True)
         
         # AI god card (bottom right)
-        if self.ai_god and self.ai_god.sprite:
-            self.ai_god.center_x = screen_width - 70
-            self.ai_god.center_y = 70
+        if self.ai_card and self.ai_card.sprite:
+            self.ai_card.center_x = screen_width - 70
+            self.ai_card.center_y = 70
             
             # Highlight if it's AI's turn
             if current_turn == 1:
                 arcade.draw_circle_outline(screen_width - 70, 70, 45, arcade.color.BLUE, 3)
             
-            self.ai_god.draw()
-            arcade.draw_text("AI", screen_width - 70, 20, arcade.color.BLUE, 10, anchor_x="center", bold=True)
+            self.ai_card.draw()
+            draw_cached_text("AI", screen_width - 70, 20, arcade.color.BLUE, 10, anchor_x="center", bold=True)
     
     def show_power_tooltip(self, x, y):
         """Show god power description when hovering"""
         # Check if mouse is over human god card
-        if self.human_god and abs(x - 70) < 45 and abs(y - 70) < 45:
-            return f"{self.human_god.name}: {self.human_god.description}"
+        if self.human_card and abs(x - 70) < 45 and abs(y - 70) < 45:
+            return f"{self.human_card.god.name}: {self.human_card.god.description}"
         # Check if mouse is over AI god card  
-        elif self.ai_god and abs(x - (800 - 70)) < 45 and abs(y - 70) < 45:
-            return f"{self.ai_god.name}: {self.ai_god.description}"
+        elif self.ai_card and abs(x - (800 - 70)) < 45 and abs(y - 70) < 45:
+            return f"{self.ai_card.god.name}: {self.ai_card.god.description}"
         return None
-
-class GodPowerManager:
-    """Manages god power integration with game logic"""
-    def __init__(self):
-        self.human_god = None
-        self.ai_god = None
-        
-    def set_gods(self, human_god, ai_god):
-        """Set the selected god powers"""
-        self.human_god = human_god
-        self.ai_god = ai_god
-        print(f"God powers set: Human={human_god.name}, AI={ai_god.name}")
-        
-    def get_god_for_player(self, player):
-        """Get the god power for a specific player"""
-        return self.human_god if player == 0 else self.ai_god
-        
-    def can_move(self, game, worker, target_pos):
-        """ACTIVE: Check if move is allowed with god power modifications"""
-        god = self.get_god_for_player(worker.owner)
-        if god:
-            return god.can_move(game, worker, target_pos)
-        return True
-        
-    def can_build(self, game, worker, target_pos):
-        """ACTIVE: Check if build is allowed with god power modifications"""
-        god = self.get_god_for_player(worker.owner)
-        if god:
-            return god.can_build(game, worker, target_pos)
-        return True
-        
-    def on_move(self, game, worker, old_pos, new_pos):
-        """ACTIVE: Trigger god power effects after move"""
-        god = self.get_god_for_player(worker.owner)
-        if god:
-            god.on_move(game, worker, old_pos, new_pos)
-            
-    def on_build(self, game, worker, build_pos):
-        """ACTIVE: Trigger god power effects after build"""
-        god = self.get_god_for_player(worker.owner)
-        if god:
-            god.on_build(game, worker, build_pos)
-            
-    def check_special_win(self, game, worker):
-        """ACTIVE: Check for special win conditions"""
-        god = self.get_god_for_player(worker.owner)
-        if god:
-            return god.has_won(game, worker)
-        return False
-
-# Factory function to create gods by name
-def create_god(name):
-    """Create a god instance by name"""
-    god_classes = {
-        "Pan": Pan,
-        "Atlas": Atlas, 
-        "Artemis": Artemis,
-        "Demeter": Demeter,
-        "Athena": Athena,
-        "Poseidon": Poseidon
-    }
-    
-    if name in god_classes:
-        return god_classes[name]()
-    return None
@@ -1,11 +1,16 @@
 import arcade
+import cProfile
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    from gameplay import Santorini
+    from santorini import Santorini, GodPowerManager
     from background import BoardView  
     from worker import WorkerView
-    from gods import GodSelectionView, InGameGodDisplay, GodPowerManager
+    from gods import GodSelectionView, InGameGodDisplay, draw_cached_text
+    from profiler import FrameProfiler
 except ImportError as e:
     print(f"Import error: {e}")
     sys.exit(1)
@@ -13,6 +18,12 @@ except ImportError as e:
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
 SCREEN_TITLE = "Santorini: Human vs AI (with God Powers)"
+AI_ENGINE = "minimax"  # "minimax" (alpha-beta) or "mcts"
+AI_ENGINE_LABELS = {"minimax": "Minimax", "mcts": "MCTS"}  # Shown while the AI is thinking
+IDLE_RENDERING = True  # Redraw only when something on screen changed
+ACTIVE_UPDATE_RATE = 1 / 60
+IDLE_UPDATE_RATE = 1 / 10  # on_update rate while nothing changes
+PROFILE_FRAMES = 120  # Frames captured by the F5 cProfile hotkey
 
 class MainWindow(arcade.Window):
     def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, title=SCREEN_TITLE):
@@ -52,6 +63,16 @@ class MainWindow(arcade.Window):
         self.ai_move_delay = 2.0
         self.ai_needs_to_act = False
         
+        # Background AI search (keeps the render thread responsive)
+        self.ai_executor = ThreadPoolExecutor(max_workers=1)
+        self.ai_future = None
+        self.ai_stop_event = None
+        
+        # Pondering: search likely human replies in a worker process while the human is thinking
+        self.pondering = AI_ENGINE == "minimax"  # MCTS rebuilds its tree every turn
+        self.ponder_future = None
+        self.ponder_stop_event = None
+        
         # Game ending state
         self.game_ended = False
         self.end_screen_timer = 0.0
@@ -68,11 +89,21 @@ class MainWindow(arcade.Window):
         # Tooltip for god powers
         self.tooltip_text = ""
         
+        # Idle-aware rendering: skip drawing (and slow down updates) while the frame is unchanged
+        self.idle_rendering = IDLE_RENDERING
+        self.frame_dirty = True
+        self.last_frame_state = None
+        self.was_animating = False  # Workers moved during the last update (their final step still needs a frame)
+        self.idle = False
+        
+        # Frame-time / AI-latency profiler (F3 overlay, F4 log, F5/F6 cProfile captures)
+        self.profiler = FrameProfiler(SCREEN_WIDTH, SCREEN_HEIGHT)
+        
         print("MainWindow initialized successfully!")
     
     def initialize_game(self):
         """Initialize game after god selection"""
-        self.game = Santorini(self.god_manager)  # Pass god manager to game
+        self.game = Santorini(self.god_manager, ai_engine=AI_ENGINE)  # Pass god manager to game
         self.board_view = BoardView(self.game, self.tile_size, self.offset_x, self.offset_y, self.margin)
         self.worker_view = WorkerView(self.game, self.board_view, radius=self.tile_size*0.25, move_time=0.30)
         self.in_game_god_display = InGameGodDisplay(
@@ -107,7 +138,8 @@ class MainWindow(arcade.Window):
                 message = "Game Over!"
         elif self.game.turn == 1:
             if self.ai_needs_to_act:
-                message = f"🤖 AI ({self.god_manager.ai_god.name}) is calculating with Minimax..."
+                dots = "." * (int(self.ai_move_timer * 3) % 4)
+                message = f"🤖 AI ({self.god_manager.ai_god.name}) is calculating with {AI_ENGINE_LABELS[AI_ENGINE]}{dots}"
             else:
                 message = f"🤖 AI ({self.god_manager.ai_god.name}) turn"
         else:
@@ -128,16 +160,78 @@ class MainWindow(arcade.Window):
         
         self.status_text.text = message
     
+    def frame_state(self):
+        """Everything the next frame depends on, apart from worker animations"""
+        if self.game_state == "god_selection":
+            selection = self.god_selection
+            return (self.game_state, selection.human_selected, selection.ai_selected)
+        
+        game = self.game
+        return (self.game_state, tuple(tuple(row) for row in game.board),
+                tuple((w.x, w.y) for w in game.workers), game.turn, game.game_over,
+                self.selected_worker_idx, self.move_selected, self.show_end_screen,
+                self.tooltip_text, self.status_text.text)
+    
+    def mark_dirty(self):
+        """Redraw on the next frame and leave the idle update rate"""
+        self.frame_dirty = True
+        if self.idle:
+            self.idle = False
+            self.set_update_rate(ACTIVE_UPDATE_RATE)
+    
+    def check_frame_dirty(self):
+        """Mark the frame dirty if the scene changed since the last update, else go idle"""
+        animating = self.game_state == "playing" and self.worker_view.any_moving()
+        finished = self.was_animating and not animating  # The last update snapped workers to their targets
+        self.was_animating = animating
+        state = self.frame_state()
+        if animating or finished or state != self.last_frame_state:
+            self.last_frame_state = state
+            self.mark_dirty()
+        elif self.idle_rendering and not self.frame_dirty and not self.idle:
+            self.idle = True
+            self.set_update_rate(IDLE_UPDATE_RATE)
+    
+    def draw(self, dt):
+        """Event loop frame: skipped entirely while idle so the last presented frame stays up"""
+        if self.idle_rendering and not self.frame_dirty:
+            return
+        super().draw(dt)
+    
+    def on_close(self):
+        """Stop the background search and pondering so the process can exit with the window"""
+        self.stop_ponder()
+        self.cancel_ai_search()
+        self.ai_executor.shutdown(wait=False, cancel_futures=True)
+        super().on_close()
+    
+    def on_resize(self, width, height):
+        super().on_resize(width, height)
+        self.mark_dirty()
+    
+    def on_expose(self):
+        """The window was uncovered: its contents have to be drawn again"""
+        self.mark_dirty()
+    
     def on_draw(self):
+        self.frame_dirty = False
+        with self.profiler.section("on_draw"):
+            self.draw_scene()
+        self.profiler.draw()
+    
+    def draw_scene(self):
+        """Draw the current screen (god selection or the game)"""
         self.clear()
         
         if self.game_state == "god_selection":
             # Draw god selection screen
-            self.god_selection.draw()
+            with self.profiler.section("gods"):
+                self.god_selection.draw()
             
         elif self.game_state == "playing":
             # Draw the game board and workers
-            self.board_view.draw()
+            with self.profiler.section("board"):
+                self.board_view.draw()
             
             # Game highlights (only when game is active)
             if not self.game.game_over and self.game.turn == 0 and self.selected_worker_idx is not None:
@@ -157,11 +251,13 @@ class MainWindow(arcade.Window):
                         arcade.draw_circle_outline(bcx, bcy, self.tile_size*0.3, arcade.color.GREEN, 4)
             
             # Draw workers
-            self.worker_view.draw()
+            with self.profiler.section("workers"):
+                self.worker_view.draw()
             
             # Draw in-game god power display
             if self.in_game_god_display:
-                self.in_game_god_display.draw(SCREEN_WIDTH, SCREEN_HEIGHT, self.game.turn)
+                with self.profiler.section("gods"):
+                    self.in_game_god_display.draw(SCREEN_WIDTH, SCREEN_HEIGHT, self.game.turn)
             
             # Draw status background
             arcade.draw_lrbt_rectangle_filled(
@@ -176,8 +272,8 @@ class MainWindow(arcade.Window):
                 arcade.draw_lrbt_rectangle_filled(
                     10, 300, 150, 200, (0, 0, 0, 200)
                 )
-                arcade.draw_text(self.tooltip_text, 15, 175, arcade.color.WHITE, 12, 
-                               width=280, multiline=True)
+                draw_cached_text(self.tooltip_text, 15, 175, arcade.color.WHITE, 12,
+                                 width=280, multiline=True)
             
             # Draw game over screen overlay
             if self.game.game_over and self.show_end_screen:
@@ -188,22 +284,31 @@ class MainWindow(arcade.Window):
                 self.restart_text.draw()
     
     def on_update(self, delta_time):
+        self.profiler.frame_started()
+        with self.profiler.section("on_update"):
+            self.update_game(delta_time)
+        if self.profiler.tick(delta_time):
+            self.mark_dirty()
+        
+        self.check_frame_dirty()
+    
+    def update_game(self, delta_time):
+        """Advance animations, the game flow and the AI turn"""
         if self.game_state == "god_selection":
             # Check if god selection is complete
             if self.god_selection.selection_complete:
                 # Set up god powers
                 self.god_manager.set_gods(
-                    self.god_selection.human_selected,
-                    self.god_selection.ai_selected
+                    self.god_selection.human_selected.god,
+                    self.god_selection.ai_selected.god
                 )
                 # Initialize game
                 self.initialize_game()
                 self.game_state = "playing"
                 
         elif self.game_state == "playing":
-            # Update worker animations
+            # Update worker animations (positions are synced on placement and moves, not here)
             self.worker_view.update(delta_time)
-            self.worker_view.sync_positions()
             
             # Clear pending moves when animation completes
             if self.move_pending_for_worker is not None and not self.worker_view.any_moving():
@@ -226,20 +331,63 @@ class MainWindow(arcade.Window):
                 if not self.ai_needs_to_act:
                     self.ai_needs_to_act = True
                     self.ai_move_timer = 0.0
+                    self.start_ai_search()
                 else:
                     self.ai_move_timer += delta_time
-                    if self.ai_move_timer >= self.ai_move_delay:
+                    # Apply the move once the minimum delay has passed and the search is done
+                    if self.ai_move_timer >= self.ai_move_delay and self.ai_future.done():
                         self.execute_ai_turn()
                         self.ai_needs_to_act = False
             
             # Update status text
             self.update_status_text()
     
+    def start_ai_search(self):
+        """Start the AI search on a snapshot of the game in the background worker"""
+        ponder_future = self.ponder_future
+        self.stop_ponder()  # The search waits for pondering to stop and uses its results
+        self.ai_stop_event = threading.Event()
+        self.ai_future = self.ai_executor.submit(run_ai_search, self.game.snapshot(), self.ai_stop_event,
+                                                 self.profiler.take_ai_capture_path(), ponder_future)
+        
+        # AI latency: request to result, including the wait for pondering to stop
+        start = time.perf_counter()
+        stop_event = self.ai_stop_event
+        def record_latency(future):
+            if not future.cancelled() and not stop_event.is_set():
+                self.profiler.record("ai_search", (time.perf_counter() - start) * 1000.0)
+        self.ai_future.add_done_callback(record_latency)
+    
+    def cancel_ai_search(self):
+        """Stop the in-flight AI search (its result is discarded)"""
+        if self.ai_future is not None:
+            self.ai_stop_event.set()
+            self.ai_future.cancel()
+        self.ai_future = None
+        self.ai_stop_event = None
+    
+    def start_ponder(self):
+        """Start pondering the human's replies in a worker process (the render thread keeps the GIL)"""
+        if not self.pondering or self.game.game_over:
+            return
+        self.ponder_future, self.ponder_stop_event = self.game.ai.ponder_in_pool(self.game.snapshot())
+    
+    def stop_ponder(self):
+        """Stop pondering (the next search collects the results found so far)"""
+        if self.ponder_future is not None:
+            self.ponder_stop_event.set()
+        self.ponder_future = None
+        self.ponder_stop_event = None
+    
     def execute_ai_turn(self):
         """Execute AI's turn using minimax with god powers"""
         try:
+            future = self.ai_future
+            self.ai_future = None
+            self.ai_stop_event = None
+            
             if self.game.phase == 'placement':
-                move = self.game.ai_get_best_move()
+                move = future.result()
                 if move:
                     col, row = move
                     if self.game.place_worker_at(self.placement_index, col, row):
@@ -248,19 +396,25 @@ class MainWindow(arcade.Window):
                         if self.placement_index < 4:
                             self.game.turn = self.placement_index // 2
             else:
-                move_result = self.game.ai_get_best_move()
+                move_result = future.result()
                 if move_result:
-                    worker, move_pos, build_pos = move_result
-                    worker_idx = self.game.workers.index(worker)
+                    worker_idx, move_pos, build_pos = move_result
+                    worker = self.game.workers[worker_idx]
                     game_won = self.game.execute_move(worker, move_pos, build_pos)
                     self.worker_view.start_move(worker_idx, move_pos)
+                    self.worker_view.sync_positions()
                     self.move_pending_for_worker = worker_idx
+                    
+                    # Use the human's thinking time
+                    self.start_ponder()
         except Exception as e:
             print(f"Error in AI turn: {e}")
     
     def restart_game(self):
         """Restart the game (back to god selection)"""
         print("Restarting game...")
+        self.cancel_ai_search()
+        self.stop_ponder()
         self.game_state = "god_selection"
         self.god_selection = GodSelectionView(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.god_manager = GodPowerManager()
@@ -290,10 +444,21 @@ class MainWindow(arcade.Window):
     
     def on_key_press(self, key, modifiers):
         """Handle key presses"""
+        self.mark_dirty()
         if key == arcade.key.R and self.game_state == "playing" and self.game.game_over:
             self.restart_game()
+        elif key == arcade.key.F3:
+            self.profiler.toggle_overlay()
+        elif key == arcade.key.F4:
+            self.profiler.toggle_logging()
+        elif key == arcade.key.F5:
+            self.profiler.start_frame_capture(PROFILE_FRAMES)
+        elif key == arcade.key.F6:
+            self.profiler.capture_ai_turn = True
+            print("Profiling the next AI turn...")
     
     def on_mouse_press(self, x, y, button, modifiers):
+        self.mark_dirty()
         if self.game_state == "god_selection":
             # Handle god selection
             if not self.god_selection.selection_complete:
@@ -370,6 +535,7 @@ class MainWindow(arcade.Window):
                         # Start animation
                         idx = self.selected_worker_idx
                         self.worker_view.start_move(idx, (col, row))
+                        self.worker_view.sync_positions()
                         self.move_pending_for_worker = idx
                         self.move_selected = (col, row)
                         
@@ -406,7 +572,33 @@ class MainWindow(arcade.Window):
     def on_mouse_motion(self, x, y, dx, dy):
         """Handle mouse motion for tooltips"""
         if self.game_state == "playing" and self.in_game_god_display:
-            self.tooltip_text = self.in_game_god_display.show_power_tooltip(x, y) or ""
+            tooltip_text = self.in_game_god_display.show_power_tooltip(x, y) or ""
+            if tooltip_text != self.tooltip_text:
+                self.tooltip_text = tooltip_text
+                self.mark_dirty()
+
+def run_ai_search(snapshot, stop_event, profile_path=None, ponder_future=None):
+    """Background job: pick the AI move on a game snapshot (workers are returned as indices).
+    
+    With a profile_path the search runs under cProfile and the stats are written there. A stopped
+    ponder_future is waited for first so its results can answer the move instantly.
+    """
+    if ponder_future is not None:
+        try:
+            snapshot.ai.ponder_results = ponder_future.result()
+        except Exception as e:
+            print(f"Pondering failed: {e}")
+    if profile_path is None:
+        move = snapshot.ai_get_best_move(stop_event)
+    else:
+        profile = cProfile.Profile()
+        move = profile.runcall(snapshot.ai_get_best_move, stop_event)
+        profile.dump_stats(profile_path)
+        print(f"AI search profile written to {profile_path}")
+    if move and snapshot.phase == 'play':
+        worker, move_pos, build_pos = move
+        return snapshot.workers.index(worker), move_pos, build_pos
+    return move
 
 def main():
     print("🏝️ Santorini: Human vs AI with God Powers")
@@ -420,6 +612,8 @@ def main():
     print("🕹️ CONTROLS:")
     print("   Click to select gods, workers and positions")
     print("   R = Restart game (when game over)")
+    print("   F3 = Frame-time overlay, F4 = Log frame times to frame_profile.jsonl")
+    print(f"   F5 = cProfile the next {PROFILE_FRAMES} frames, F6 = cProfile the next AI turn")
     print("=" * 50)
     
     window = MainWindow()
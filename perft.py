@@ -0,0 +1,195 @@
+"""Perft and differential testing for the move generators.
+
+Perft counts the action sequences of exactly N plies from a position (a
+winning action ends its sequence early and counts as one). The counts
+pin down move generation under every god power and double as a raw
+generation throughput benchmark. Both generators can be counted: the
+list-based reference (Santorini.all_actions) and the BitBoard masks.
+
+    python perft.py --depth 3                       # whole benchmark corpus
+    python perft.py --depth 2 --position 4 --divide # counts per root action
+    python perft.py --depth 3 --generator bitboard
+    python perft.py --diff --games 500              # reference vs bitboard on random games
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+
+from benchmark import CORPUS, build_position
+from santorini.gameplay import BitBoard
+from santorini.gods import GOD_NAMES
+from santorini.selfplay import new_game
+
+def perft(game, depth):
+    """Number of action sequences of `depth` plies from a Santorini position (played in place)"""
+    if depth == 0:
+        return 1
+    count = 0
+    for action in game.all_actions(game.turn):
+        record = game.apply_action(*action)
+        if game.game_over:
+            count += 1
+        else:
+            game.switch_turn()
+            count += perft(game, depth - 1)
+        game.undo_action(record)
+    return count
+
+def perft_bitboard(bb, depth):
+    """Same count as perft() using the BitBoard generator"""
+    if depth == 0:
+        return 1
+    count = 0
+    player = bb.turn
+    for action in bb.all_actions(player):
+        record = bb.apply_action(*action)
+        if bb.winner is not None:
+            count += 1
+        else:
+            bb.turn = 1 - player
+            count += perft_bitboard(bb, depth - 1)
+            bb.turn = player
+        bb.undo_action(record)
+    return count
+
+def divide(game, depth, generator):
+    """{root action: perft count below it} with the chosen generator"""
+    counts = {}
+    if generator == "bitboard":
+        bb = BitBoard.from_game(game)
+        player = bb.turn
+        for action in bb.all_actions(player):
+            record = bb.apply_action(*action)
+            if bb.winner is not None or depth == 1:
+                counts[action] = 1
+            else:
+                bb.turn = 1 - player
+                counts[action] = perft_bitboard(bb, depth - 1)
+                bb.turn = player
+            bb.undo_action(record)
+    else:
+        for action in game.all_actions(game.turn):
+            record = game.apply_action(*action)
+            if game.game_over or depth == 1:
+                counts[action] = 1
+            else:
+                game.switch_turn()
+                counts[action] = perft(game, depth - 1)
+            game.undo_action(record)
+    return counts
+
+def count(game, depth, generator):
+    """Perft count of a position with the chosen generator"""
+    if generator == "bitboard":
+        return perft_bitboard(BitBoard.from_game(game), depth)
+    return perft(game, depth)
+
+def run_perft(positions, depth, generator, show_divide):
+    """Print perft counts and generation speed for corpus positions"""
+    total_nodes = 0
+    total_seconds = 0.0
+    for index in positions:
+        entry = CORPUS[index]
+        game = build_position(entry)
+        start = time.perf_counter()
+        if show_divide:
+            counts = divide(game, depth, generator)
+            nodes = sum(counts.values())
+        else:
+            nodes = count(game, depth, generator)
+        seconds = time.perf_counter() - start
+        total_nodes += nodes
+        total_seconds += seconds
+
+        phase, god0, god1 = entry[:3]
+        print(f"#{index:<3}{phase:<9}{god0 + ' vs ' + god1:<22}perft({depth}) = {nodes:>10}"
+              f"  ({nodes / seconds:,.0f} leaves/s)")
+        if show_divide:
+            for action, nodes in sorted(counts.items()):
+                print(f"    {action}: {nodes}")
+    print(f"Total {total_nodes} leaves in {total_seconds:.2f}s "
+          f"({total_nodes / total_seconds:,.0f} leaves/s, {generator})")
+
+def describe(game):
+    """One-line position description for mismatch reports"""
+    heights = ''.join(str(game.board[row][col]) for row in range(5) for col in range(5))
+    squares = tuple(w.y * 5 + w.x for w in game.workers)
+    return f"heights={heights} workers={squares} turn={game.turn}"
+
+def differential(games, seed, max_plies=60):
+    """Play random games with the reference game and a BitBoard side by side.
+
+    After every action both generators must list the same actions and agree on the winner, and
+    the bitboard must convert back (to_game) to the same position. Returns the first mismatch as
+    a string, or None.
+    """
+    rng = random.Random(seed)
+    # Same-god pairs too (god state is per player), and games where one or both players have no god
+    god_pairs = list(itertools.product(GOD_NAMES + [None], repeat=2))
+    positions = 0
+    for number in range(games):
+        gods = rng.choice(god_pairs)
+        game = new_game(gods)
+        for index, square in enumerate(rng.sample(range(25), 4)):
+            game.place_worker_at(index, square % 5, square // 5)
+        game.turn = 0
+        game.compute_hash()
+        bb = BitBoard.from_game(game)
+
+        history = []
+        for ply in range(max_plies):
+            positions += 1
+            reference = sorted(game.all_actions(game.turn))
+            fast = sorted(bb.all_actions(bb.turn))
+            if reference != fast:
+                missing = sorted(set(reference) - set(fast))
+                extra = sorted(set(fast) - set(reference))
+                return (f"game {number} ({gods[0]} vs {gods[1]}) ply {ply}: {describe(game)}\n"
+                        f"  actions so far: {history}\n"
+                        f"  only in reference: {missing}\n  only in bitboard: {extra}")
+            back = bb.to_game(new_game(gods).god_manager)
+            if back.position_key() != game.position_key() or sorted(back.all_actions(back.turn)) != reference:
+                return (f"game {number} ({gods[0]} vs {gods[1]}) ply {ply}: {describe(game)}\n"
+                        f"  actions so far: {history}\n  to_game() gives a different position")
+            if not reference:
+                break
+
+            action = rng.choice(reference)
+            history.append(action)
+            game.do_action(*action)
+            bb.apply_action(*action)
+            if game.winner != bb.winner:
+                return (f"game {number} ({gods[0]} vs {gods[1]}) ply {ply}: winner after {action} is "
+                        f"{game.winner} (reference) vs {bb.winner} (bitboard)\n  actions so far: {history}")
+            if game.game_over:
+                break
+            game.switch_turn()
+            bb.turn = game.turn
+    print(f"{games} games, {positions} positions: generators agree")
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft counts and move generator differential tests")
+    parser.add_argument("--depth", type=int, default=2, help="perft depth in plies")
+    parser.add_argument("--position", type=int, action="append", help="corpus index (default: all)")
+    parser.add_argument("--generator", choices=["reference", "bitboard"], default="reference")
+    parser.add_argument("--divide", action="store_true", help="print the count below each root action")
+    parser.add_argument("--diff", action="store_true", help="compare the generators on random games")
+    parser.add_argument("--games", type=int, default=200, help="random games for --diff")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --diff")
+    args = parser.parse_args()
+
+    if args.diff:
+        mismatch = differential(args.games, args.seed)
+        if mismatch:
+            print("Mismatch in " + mismatch)
+            sys.exit(1)
+        return
+
+    positions = args.position or range(len(CORPUS))
+    run_perft(positions, args.depth, args.generator, args.divide)
+
+if __name__ == "__main__":
+    main()
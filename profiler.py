@@ -0,0 +1,163 @@
+#profiler.py
+import cProfile
+import json
+import time
+from collections import deque
+
+import arcade
+
+# Timed sections, in overlay order
+SECTIONS = ("on_update", "on_draw", "board", "workers", "gods", "ai_search")
+
+class Section:
+    """Context manager adding the time spent in its block to one profiler section"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.profiler.active else None
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start is not None:
+            self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+
+class FrameProfiler:
+    """Rolling frame and AI timings with an overlay, a JSONL log and cProfile captures.
+
+    Timings are only collected while the overlay or the log is on, so the
+    sections cost one attribute check per frame otherwise.
+    """
+    def __init__(self, screen_width, screen_height, samples=300, log_path="frame_profile.jsonl",
+                 log_interval=5.0, refresh_interval=0.5):
+        self.samples = {name: deque(maxlen=samples) for name in SECTIONS}
+        self.sections = {name: Section(self, name) for name in SECTIONS}
+        self.log_path = log_path
+        self.log_interval = log_interval
+        self.refresh_interval = refresh_interval
+
+        self.show_overlay = False
+        self.logging = False
+        self.active = False
+        self.refresh_timer = 0.0
+        self.log_timer = 0.0
+
+        # cProfile capture of the next frames (the next AI turn is profiled by the search job)
+        self.capture = None
+        self.capture_path = None
+        self.capture_frames_left = 0
+        self.capture_ai_turn = False
+
+        # Overlay: a single multiline text (one draw call), re-laid out only on refresh
+        self.right = screen_width - 10
+        self.top = screen_height - 70
+        self.overlay_text = arcade.Text("", self.right - 330, self.top, arcade.color.WHITE, 11, width=330,
+                                        anchor_y="top", multiline=True,
+                                        font_name=("Courier New", "DejaVu Sans Mono"))
+
+    def section(self, name):
+        """Reusable `with` block timing one section"""
+        return self.sections[name]
+
+    def record(self, name, ms):
+        """Add one timing in milliseconds (safe to call from the AI worker thread)"""
+        if self.active:
+            self.samples[name].append(ms)
+
+    def percentiles(self, name):
+        """(p50, p95, p99) of the rolling window of a section in ms, or None before any sample"""
+        values = sorted(self.samples[name])
+        if not values:
+            return None
+        count = len(values)
+        return tuple(values[min(count - 1, int(q * count))] for q in (0.50, 0.95, 0.99))
+
+    def summary(self):
+        """{section: {"p50", "p95", "p99", "n"}} for sections with samples"""
+        result = {}
+        for name in SECTIONS:
+            stats = self.percentiles(name)
+            if stats:
+                result[name] = {"p50": round(stats[0], 3), "p95": round(stats[1], 3),
+                                "p99": round(stats[2], 3), "n": len(self.samples[name])}
+        return result
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.active = self.show_overlay or self.logging
+        self.refresh_timer = self.refresh_interval  # Fill the overlay on the next tick
+
+    def toggle_logging(self):
+        self.logging = not self.logging
+        self.active = self.show_overlay or self.logging
+        self.log_timer = 0.0
+        print(f"Frame profile logging {'on' if self.logging else 'off'} ({self.log_path})")
+
+    def tick(self, delta_time):
+        """Per-update bookkeeping: overlay refresh and log lines. Returns True if the overlay changed"""
+        changed = False
+        if self.show_overlay:
+            self.refresh_timer += delta_time
+            if self.refresh_timer >= self.refresh_interval:
+                self.refresh_timer = 0.0
+                self.refresh_overlay()
+                changed = True
+        if self.logging:
+            self.log_timer += delta_time
+            if self.log_timer >= self.log_interval:
+                self.log_timer = 0.0
+                with open(self.log_path, "a") as f:
+                    f.write(json.dumps({"time": round(time.time(), 3), **self.summary()}) + "\n")
+        return changed
+
+    def refresh_overlay(self):
+        """Re-lay out the overlay lines from the current percentiles"""
+        lines = [f"{'ms':<10}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name in SECTIONS:
+            stats = self.percentiles(name)
+            if stats:
+                lines.append(f"{name:<10}{stats[0]:>8.2f}{stats[1]:>8.2f}{stats[2]:>8.2f}")
+            else:
+                lines.append(f"{name:<10}{'-':>8}{'-':>8}{'-':>8}")
+        self.overlay_text.text = "\n".join(lines)
+
+    def draw(self):
+        """Draw the overlay (top right, under the status bar)"""
+        if not self.show_overlay:
+            return
+        bottom = self.top - self.overlay_text.content_height - 5
+        arcade.draw_lrbt_rectangle_filled(self.right - 335, self.right + 5, bottom, self.top + 5, (0, 0, 0, 190))
+        self.overlay_text.draw()
+
+    def start_frame_capture(self, frames):
+        """cProfile the next `frames` updates and draws into a timestamped .prof file"""
+        if self.capture is not None:
+            return
+        self.capture_path = f"profile-frames-{time.strftime('%Y%m%d-%H%M%S')}.prof"
+        self.capture_frames_left = frames
+        self.capture = cProfile.Profile()
+        self.capture.enable()
+        print(f"Profiling the next {frames} frames...")
+
+    def frame_started(self):
+        """Count down a frame capture (call at the start of every update)"""
+        if self.capture is None:
+            return
+        if self.capture_frames_left > 0:
+            self.capture_frames_left -= 1
+            return
+        self.capture.disable()
+        self.capture.dump_stats(self.capture_path)
+        print(f"Frame profile written to {self.capture_path}")
+        self.capture = None
+
+    def take_ai_capture_path(self):
+        """File for profiling the AI search about to start, or None if no capture was requested"""
+        if not self.capture_ai_turn:
+            return None
+        self.capture_ai_turn = False
+        return f"profile-ai-{time.strftime('%Y%m%d-%H%M%S')}.prof"
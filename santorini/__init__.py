@@ -0,0 +1,12 @@
+"""Santorini rules and AI search, importable without arcade or a window.
+
+The arcade front end (main.py) and the headless tools build on this package;
+`python -m santorini` runs analysis or self-play from the command line.
+"""
+from .gameplay import AIPlayer, BitBoard, MCTSPlayer, Santorini, TranspositionTable, Worker
+from .gods import GOD_NAMES, GodPower, GodPowerManager, create_god
+
+__all__ = [
+    "AIPlayer", "BitBoard", "MCTSPlayer", "Santorini", "TranspositionTable", "Worker",
+    "GOD_NAMES", "GodPower", "GodPowerManager", "create_god",
+]
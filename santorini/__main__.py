@@ -0,0 +1,83 @@
+"""Headless command line: analyse a position or watch the engines play each other.
+
+    python -m santorini analyse --heights 0001020010002110100000100 --workers 10,17,7,2 --gods Pan,Atlas
+    python -m santorini selfplay --engine "a:depth=3" --engine "b:type=mcts,time=500" --gods Athena,Pan
+
+Positions are 25 height digits (square = row * 5 + col) plus the four worker
+squares, player 0's workers first. Engine specs are as in arena.py.
+"""
+import argparse
+import time
+
+from .gods import GOD_NAMES
+from .selfplay import MAX_PLIES, load_position, make_player, parse_engine, play_game
+
+def parse_gods(value):
+    """(player 0 god, player 1 god) from "Pan,Atlas" ("none" = no god)"""
+    names = [name.strip() for name in value.split(",")]
+    if len(names) != 2:
+        raise argparse.ArgumentTypeError("give two gods, e.g. Pan,Atlas")
+    gods = []
+    for name in names:
+        if name.lower() == "none":
+            gods.append(None)
+        elif name in GOD_NAMES:
+            gods.append(name)
+        else:
+            raise argparse.ArgumentTypeError(f"unknown god: {name}")
+    return tuple(gods)
+
+def analyse(args):
+    """Search one position and print the chosen action"""
+    squares = [int(square) for square in args.workers.split(",")]
+    game = load_position(args.gods, args.heights, squares, args.turn)
+    config = parse_engine(args.engine)
+    player = make_player(config, game.turn, game.god_manager)
+
+    start = time.perf_counter()
+    action = player.choose_action(game)
+    elapsed = (time.perf_counter() - start) * 1000.0
+
+    print(f"best action: {action}")
+    depth = getattr(player, "completed_depth", None)
+    print(f"{player.nodes} nodes in {elapsed:.0f} ms" + (f", depth {depth}" if depth else ""))
+
+def selfplay(args):
+    """Play one game between two engines and print every action"""
+    configs = [parse_engine(spec) for spec in args.engine]
+    if len(configs) != 2:
+        raise SystemExit("selfplay needs exactly two --engine specs")
+
+    def show(game, action, think_ms):
+        print(f"{configs[game.turn]['name']:>12}: {action}  ({think_ms:.0f} ms)")
+
+    result = play_game(configs, args.gods, args.seed, args.max_plies, on_action=show)
+    if result["winner"] is None:
+        print(f"Draw after {result['plies']} actions")
+    else:
+        print(f"{result['engines'][result['winner']]} wins after {result['plies']} actions")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m santorini", description="Headless Santorini engine")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_analyse = commands.add_parser("analyse", help="search a position")
+    parser_analyse.add_argument("--heights", default="0" * 25, help="25 height digits, square = row * 5 + col")
+    parser_analyse.add_argument("--workers", required=True, help="four worker squares, player 0 first")
+    parser_analyse.add_argument("--turn", type=int, choices=[0, 1], default=0, help="player to move")
+    parser_analyse.add_argument("--gods", type=parse_gods, default=(None, None), help="e.g. Pan,Atlas")
+    parser_analyse.add_argument("--engine", default="engine:time=1500", help="engine spec")
+    parser_analyse.set_defaults(run=analyse)
+
+    parser_selfplay = commands.add_parser("selfplay", help="play the engines against each other")
+    parser_selfplay.add_argument("--engine", action="append", default=[], help="engine spec (give two)")
+    parser_selfplay.add_argument("--gods", type=parse_gods, default=(None, None), help="e.g. Pan,Atlas")
+    parser_selfplay.add_argument("--seed", type=int, default=0, help="seed for placement and evaluation noise")
+    parser_selfplay.add_argument("--max-plies", type=int, default=MAX_PLIES, help="actions before a draw")
+    parser_selfplay.set_defaults(run=selfplay)
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
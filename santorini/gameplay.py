@@ -0,0 +1,1852 @@
+import random
+import copy
+import math
+import os
+import time
+
+# Zobrist keys for hashing positions (fixed seed so hashes are reproducible)
+_zobrist_rng = random.Random(20240601)
+ZOBRIST_HEIGHT = [[_zobrist_rng.getrandbits(64) for _ in range(5)] for _ in range(25)]  # [square][height]
+ZOBRIST_WORKER = [[_zobrist_rng.getrandbits(64) for _ in range(25)] for _ in range(4)]  # [owner*2+id][square]
+ZOBRIST_TURN = _zobrist_rng.getrandbits(64)  # Player 1 to move
+ZOBRIST_ATHENA = [_zobrist_rng.getrandbits(64) for _ in range(2)]  # [blocked player]
+ZOBRIST_DEMETER = [[_zobrist_rng.getrandbits(64) for _ in range(25)] for _ in range(4)]  # [worker][first build]
+ZOBRIST_PAN = [[_zobrist_rng.getrandbits(64) for _ in range(5)] for _ in range(4)]  # [worker][previous height]
+EMPTY_BOARD_HASH = 0
+for _square_keys in ZOBRIST_HEIGHT:
+    EMPTY_BOARD_HASH ^= _square_keys[0]
+
+class Worker:
+    def __init__(self, owner, worker_id, x=None, y=None):
+        self.owner = owner  # 0 (human/red) or 1 (AI/blue)
+        self.worker_id = worker_id  # 0 or 1 for each player
+        self.x = x
+        self.y = y
+        self.previous_height = 0  # For god power effects like Pan
+
+# Evaluation weights: score per worker height (0-3), per legal move and per buildable neighbour
+DEFAULT_EVAL_WEIGHTS = {
+    "height": (0, 10, 30, 1000),
+    "mobility": 2,
+    "builds": 0,
+}
+
+# Late-move reductions: only at this remaining depth or more, and from this action index on
+LMR_MIN_DEPTH = 3
+LMR_MIN_INDEX = 3
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget is used up"""
+    pass
+
+class TranspositionTable:
+    """Fixed-size table of search results keyed by Zobrist hash"""
+    EXACT = 0  # Score is exact
+    LOWER = 1  # Score is a lower bound (search failed high)
+    UPPER = 2  # Score is an upper bound (search failed low)
+    
+    def __init__(self, size_bits=16):
+        self.size = 1 << size_bits
+        self.mask = self.size - 1
+        self.entries = [None] * self.size  # (key, depth, score, flag, best_action, generation)
+        self.generation = 0
+    
+    def new_search(self):
+        """Age existing entries so the next search may overwrite them"""
+        self.generation += 1
+    
+    def probe(self, key):
+        """Return the entry stored for this key, or None"""
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+    
+    def store(self, key, depth, score, flag, best_action):
+        """Store a search result (depth-preferred replacement within the same search)"""
+        index = key & self.mask
+        old = self.entries[index]
+        if old is not None and old[5] == self.generation and old[1] > depth:
+            return  # Keep the deeper result from the current search
+        self.entries[index] = (key, depth, score, flag, best_action, self.generation)
+    
+    def clear(self):
+        """Drop all entries"""
+        self.entries = [None] * self.size
+
+class AIPlayer:
+    def __init__(self, player_id, depth=3, god_manager=None, use_alpha_beta=True,
+                 use_transposition_table=True, tt_size_bits=16, time_budget_ms=None, max_depth=20,
+                 parallel_workers=0, eval_weights=None, quiescence_depth=4, use_pvs=True,
+                 aspiration_window=50, use_lmr=True, ponder_max_replies=8, ponder_budget_ms=12000,
+                 eval_noise=True):
+        self.player_id = player_id
+        self.depth = depth  # Fixed search depth when there is no time budget
+        self.god_manager = god_manager
+        self.use_alpha_beta = use_alpha_beta  # False = plain minimax (reference search)
+        self.eval_weights = dict(DEFAULT_EVAL_WEIGHTS, **(eval_weights or {}))
+        self.eval_noise = eval_noise  # Small random jitter so equal positions don't always play the same way
+        self.nodes = 0  # Nodes visited by the last search
+        
+        # Transposition table (allocated on first search so clones stay cheap)
+        self.use_transposition_table = use_transposition_table
+        self.tt_size_bits = tt_size_bits
+        self.tt = None
+        
+        # Iterative deepening: search deeper until the time budget runs out
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        self.quiescence_depth = quiescence_depth  # Extra forcing plies at the horizon (0 = off)
+        self.use_pvs = use_pvs  # Null-window searches for actions after the first
+        self.aspiration_window = aspiration_window  # Root window around the last score (0 = off)
+        self.use_lmr = use_lmr  # Search late quiet actions one ply shallower first
+        self.deadline = None
+        self.completed_depth = 0  # Depth of the last fully searched iteration
+        self.stop_event = None  # threading.Event that cancels the running search
+        
+        # Root splitting across a process pool (0 = search in this process)
+        self.parallel_workers = parallel_workers
+        
+        # Results of pondering on the opponent's time: position key -> action
+        self.ponder_results = {}
+        self.ponder_max_replies = ponder_max_replies  # Most likely replies searched per ponder call
+        self.ponder_budget_ms = ponder_budget_ms  # Total search time per ponder call
+    
+    def __getstate__(self):
+        """Pickle only the settings (process pool jobs bring their own table and clock)"""
+        state = self.__dict__.copy()
+        state['tt'] = None
+        state['deadline'] = None
+        state['stop_event'] = None
+        return state
+    
+    def evaluate(self, game):
+        """Heuristic evaluation function with god power considerations.
+        
+        Uses the game's incremental per-worker terms when it tracks them (see track_eval_terms).
+        """
+        terms = game.eval_terms
+        if terms is None:
+            terms = [game.worker_eval_terms(w) for w in game.workers]
+        
+        height_scores = self.eval_weights["height"]
+        mobility_weight = self.eval_weights["mobility"]
+        build_weight = self.eval_weights["builds"]
+        
+        score = 0
+        for index, (height, moves, builds) in enumerate(terms):
+            # Height (level 3 = winning), mobility (considering god powers) and room to build
+            worker_score = height_scores[height] + moves * mobility_weight + builds * build_weight
+            if index >> 1 == self.player_id:
+                score += worker_score
+            else:
+                score -= worker_score
+        
+        # God power specific evaluation
+        if self.god_manager:
+            my_god = self.god_manager.get_god_for_player(self.player_id)
+            if my_god:
+                # Add god-specific bonuses
+                if my_god.name == "Atlas":
+                    score += 20  # Dome building advantage
+                elif my_god.name == "Pan":
+                    score += 15  # Drop-down win condition
+                elif my_god.name == "Artemis":
+                    score += 25  # Double movement advantage
+        
+        if self.eval_noise:
+            score += random.randint(-3, 3)
+        return score
+    
+    def terminal_score(self, game):
+        """Score of a finished position (win, loss or stalemate), or None if play continues"""
+        # Check for immediate win/loss (including god power wins)
+        for w in game.workers:
+            if game.has_won(w):
+                if w.owner == self.player_id:
+                    return 10000  # AI wins
+                else:
+                    return -10000  # Human wins
+            
+            # Check god power special wins
+            if game.god_manager and game.god_manager.check_special_win(game, w):
+                if w.owner == self.player_id:
+                    return 10000
+                else:
+                    return -10000
+        
+        # Check for losing position (no moves available)
+        if game.is_losing_position(game.turn):
+            if game.turn == self.player_id:
+                return -10000
+            else:
+                return 10000
+        
+        return None
+    
+    def order_actions(self, game, actions):
+        """Sort actions best-first: winning climbs, blocks, then up-moves, then builds next to the opponent"""
+        board = game.board
+        threats = must_block(game)
+        workers = {w.worker_id: w for w in game.get_player_workers(game.turn)}
+        opponents = [(w.x, w.y) for w in game.workers if w.owner != game.turn and w.x is not None]
+        
+        # Pan also wins by jumping down two levels
+        is_pan = False
+        if game.god_manager:
+            god = game.god_manager.get_god_for_player(game.turn)
+            is_pan = god is not None and god.name == "Pan"
+        
+        def priority(action):
+            worker_id, (mx, my), (bx, by) = action
+            worker = workers[worker_id]
+            old_height = board[worker.y][worker.x]
+            new_height = board[my][mx]
+            
+            score = 0
+            if new_height == 3 or (is_pan and old_height - new_height >= 2):
+                score += 10000  # Winning move
+            if (bx, by) in threats:
+                score += 1000  # Blocks an opponent's winning climb
+            score += (new_height - old_height) * 100  # Prefer climbing
+            for ox, oy in opponents:
+                if max(abs(bx - ox), abs(by - oy)) == 1:
+                    score += 10  # Build next to an opponent worker
+                    break
+            return score
+        
+        # Stable sort keeps generation order among equal priorities
+        return sorted(actions, key=priority, reverse=True)
+    
+    def count_node(self):
+        """Count a visited node and abort the search once the deadline has passed or it is cancelled"""
+        self.nodes += 1
+        if not self.nodes & 63:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise SearchTimeout()
+    
+    def minimax(self, game, depth, maximizing):
+        """Minimax algorithm with god power integration"""
+        self.count_node()
+        
+        # Check for immediate win/loss and stalemate
+        score = self.terminal_score(game)
+        if score is not None:
+            return score, None
+        
+        # Base case: depth limit reached
+        if depth == 0:
+            return self.evaluate(game), None
+        
+        # Get all possible actions
+        actions = game.all_actions(game.turn)
+        if not actions:
+            return self.evaluate(game), None
+        
+        if maximizing:
+            max_eval = float('-inf')
+            best_action = None
+            
+            for action in actions:
+                # Create game copy and simulate action
+                game_clone = game.clone()
+                game_clone.do_action(*action)
+                game_clone.turn = 1 - game_clone.turn
+                
+                eval_score, _ = self.minimax(game_clone, depth - 1, False)
+                
+                if eval_score > max_eval:
+                    max_eval = eval_score
+                    best_action = action
+            
+            return max_eval, best_action
+        else:
+            min_eval = float('inf')
+            best_action = None
+            
+            for action in actions:
+                # Create game copy and simulate action
+                game_clone = game.clone()
+                game_clone.do_action(*action)
+                game_clone.turn = 1 - game_clone.turn
+                
+                eval_score, _ = self.minimax(game_clone, depth - 1, True)
+                
+                if eval_score < min_eval:
+                    min_eval = eval_score
+                    best_action = action
+            
+            return min_eval, best_action
+    
+    def alphabeta(self, game, depth, alpha, beta, maximizing, root_actions=None):
+        """Minimax with alpha-beta pruning and move ordering (same score as minimax, fewer nodes).
+        
+        root_actions restricts the search to some of this position's actions (root splitting).
+        """
+        self.count_node()
+        
+        # Terminal checks with the threat detector (the last action set game_over if it won)
+        if game.game_over:
+            return (10000 if game.winner == self.player_id else -10000), None
+        if is_stalemated(game, game.turn):
+            return (-10000 if game.turn == self.player_id else 10000), None
+        
+        # Base case: depth limit reached, resolve pending threats first
+        if depth == 0:
+            if not self.quiescence_depth:
+                return self.evaluate(game), None
+            return self.quiescence(game, alpha, beta, maximizing, self.quiescence_depth), None
+        
+        # Side to move can win right away: no need to search
+        winning_action = find_winning_action(game, game.turn)
+        if winning_action is not None:
+            return (10000 if game.turn == self.player_id else -10000), winning_action
+        
+        # Transposition table lookup (not for a partial root: its result only covers some actions)
+        tt = self.tt if root_actions is None else None
+        tt_action = None
+        if tt is not None:
+            key = game.position_key()
+            entry = tt.probe(key)
+            if entry is not None:
+                _, tt_depth, tt_score, tt_flag, tt_action, _ = entry
+                if tt_depth >= depth:
+                    if tt_flag == TranspositionTable.EXACT:
+                        return tt_score, tt_action
+                    if tt_flag == TranspositionTable.LOWER:
+                        alpha = max(alpha, tt_score)
+                    else:
+                        beta = min(beta, tt_score)
+                    if alpha >= beta:
+                        return tt_score, tt_action
+        alpha_orig, beta_orig = alpha, beta
+        
+        actions = game.all_actions(game.turn) if root_actions is None else root_actions
+        if not actions:
+            return self.evaluate(game), None
+        
+        actions = self.order_actions(game, actions)
+        if tt_action in actions:
+            # Best action from an earlier search goes first
+            actions.remove(tt_action)
+            actions.insert(0, tt_action)
+        
+        # Late-move reductions only in calm positions with depth to spare
+        quiet = None
+        if self.use_lmr and depth >= LMR_MIN_DEPTH and not must_block(game):
+            quiet = self.quiet_actions(game, actions[LMR_MIN_INDEX:])
+        
+        best_action = None
+        if maximizing:
+            best_score = float('-inf')
+            for index, action in enumerate(actions):
+                reduce = quiet is not None and index >= LMR_MIN_INDEX and action in quiet
+                record = game.apply_action(*action)
+                game.switch_turn()
+                try:
+                    eval_score = self.search_child(game, depth - 1, alpha, beta, False, index == 0, reduce)
+                finally:
+                    game.undo_action(record)
+                
+                if eval_score > best_score:
+                    best_score = eval_score
+                    best_action = action
+                alpha = max(alpha, best_score)
+                if alpha >= beta:
+                    break  # Beta cutoff: opponent will avoid this line
+        else:
+            best_score = float('inf')
+            for index, action in enumerate(actions):
+                reduce = quiet is not None and index >= LMR_MIN_INDEX and action in quiet
+                record = game.apply_action(*action)
+                game.switch_turn()
+                try:
+                    eval_score = self.search_child(game, depth - 1, alpha, beta, True, index == 0, reduce)
+                finally:
+                    game.undo_action(record)
+                
+                if eval_score < best_score:
+                    best_score = eval_score
+                    best_action = action
+                beta = min(beta, best_score)
+                if alpha >= beta:
+                    break  # Alpha cutoff: we will avoid this line
+        
+        if tt is not None:
+            if best_score <= alpha_orig:
+                flag = TranspositionTable.UPPER
+            elif best_score >= beta_orig:
+                flag = TranspositionTable.LOWER
+            else:
+                flag = TranspositionTable.EXACT
+            tt.store(key, depth, best_score, flag, best_action)
+        
+        return best_score, best_action
+    
+    def search_child(self, game, depth, alpha, beta, maximizing, first, reduce):
+        """Score of a child position (`maximizing` is the child's side) inside the parent's window.
+        
+        Later actions are first tried with a null window (PVS) and, if `reduce`, one ply shallower
+        (LMR). They are only searched again in full when they might beat the best action so far.
+        """
+        if first or not (self.use_pvs or reduce):
+            return self.alphabeta(game, depth, alpha, beta, maximizing)[0]
+        
+        # The parent improves alpha when maximizing (child minimizing) and beta otherwise
+        if not self.use_pvs:
+            low, high = alpha, beta
+        elif maximizing:
+            low, high = beta - 1, beta
+        else:
+            low, high = alpha, alpha + 1
+        
+        if reduce:
+            score = self.alphabeta(game, depth - 1, low, high, maximizing)[0]
+            if (score >= beta) if maximizing else (score <= alpha):
+                return score  # Still no better than the best action: the reduction stands
+        if self.use_pvs:
+            score = self.alphabeta(game, depth, low, high, maximizing)[0]
+            if not alpha < score < beta:
+                return score
+        return self.alphabeta(game, depth, alpha, beta, maximizing)[0]
+    
+    def quiet_actions(self, game, actions):
+        """The actions that neither climb nor build next to another worker (candidates for LMR)"""
+        board = game.board
+        workers = {w.worker_id: w for w in game.get_player_workers(game.turn)}
+        quiet = set()
+        for action in actions:
+            worker_id, (mx, my), (bx, by) = action
+            worker = workers[worker_id]
+            if board[my][mx] > board[worker.y][worker.x]:
+                continue
+            for w in game.workers:
+                if w is not worker and w.x is not None and max(abs(bx - w.x), abs(by - w.y)) == 1:
+                    break
+            else:
+                quiet.add(action)
+        return quiet
+    
+    def forcing_actions(self, game):
+        """Actions that answer or set up a climb to level 3: (actions, threatened).
+        
+        When the opponent threatens to climb, only blocks count (building on, or moving onto, a
+        threatened square). Otherwise they are domes on level-3 squares next to an opponent worker.
+        """
+        threats = must_block(game)
+        if threats:
+            targets = threats
+        else:
+            board = game.board
+            targets = set()
+            for w in game.workers:
+                if w.owner == game.turn or w.x is None:
+                    continue
+                for square in NEIGHBOR_SQUARES[w.y * 5 + w.x]:
+                    col, row = SQUARE_COORDS[square]
+                    if board[row][col] == 3:
+                        targets.add((col, row))
+        if not targets:
+            return [], False  # Skip action generation in quiet positions
+        
+        actions = [action for action in game.all_actions(game.turn)
+                   if action[2] in targets or (threats and action[1] in threats)]
+        return actions, bool(threats)
+    
+    def quiescence(self, game, alpha, beta, maximizing, qdepth):
+        """Search only forcing actions past the depth limit so the evaluation sees settled positions.
+        
+        Climbs to level 3 are caught by the winning-action check; a side facing a climb has to block
+        it and may not stand pat on the static evaluation.
+        """
+        self.count_node()
+        
+        if game.game_over:
+            return 10000 if game.winner == self.player_id else -10000
+        if is_stalemated(game, game.turn):
+            return -10000 if game.turn == self.player_id else 10000
+        if find_winning_action(game, game.turn) is not None:
+            return 10000 if game.turn == self.player_id else -10000
+        
+        loss = -10000 if maximizing else 10000
+        if qdepth == 0:
+            return self.evaluate(game)
+        actions, threatened = self.forcing_actions(game)
+        if threatened:
+            if not actions:
+                return loss  # Nothing stops the opponent's climb
+            best_score = loss
+        else:
+            # Stand pat: a quiet action is assumed to keep the static evaluation
+            best_score = self.evaluate(game)
+            if maximizing:
+                if best_score >= beta:
+                    return best_score
+                alpha = max(alpha, best_score)
+            else:
+                if best_score <= alpha:
+                    return best_score
+                beta = min(beta, best_score)
+        
+        for action in self.order_actions(game, actions):
+            record = game.apply_action(*action)
+            game.switch_turn()
+            try:
+                eval_score = self.quiescence(game, alpha, beta, not maximizing, qdepth - 1)
+            finally:
+                game.undo_action(record)
+            
+            if maximizing:
+                best_score = max(best_score, eval_score)
+                alpha = max(alpha, best_score)
+            else:
+                best_score = min(best_score, eval_score)
+                beta = min(beta, best_score)
+            if alpha >= beta:
+                break
+        return best_score
+    
+    def search(self, game, depth):
+        """Search the root position to a fixed depth, returns (score, action)"""
+        if self.use_alpha_beta:
+            return self.alphabeta(game, depth, float('-inf'), float('inf'), True)
+        return self.minimax(game, depth, True)
+    
+    def aspiration_search(self, game, depth, previous_score):
+        """Search in a narrow window around the previous iteration's score, widening it on a miss"""
+        window = self.aspiration_window
+        if not (self.use_alpha_beta and window) or previous_score is None or abs(previous_score) >= 10000:
+            return self.search(game, depth)
+        
+        alpha, beta = previous_score - window, previous_score + window
+        score, action = self.alphabeta(game, depth, alpha, beta, True)
+        if alpha < score < beta:
+            return score, action
+        return self.search(game, depth)  # Fell outside the window: the score is only a bound
+    
+    def iterative_deepening(self, game, time_budget_ms):
+        """Search depth 1, 2, 3... until the budget runs out; best action of the last completed depth"""
+        self.deadline = time.perf_counter() + time_budget_ms / 1000.0
+        best_action = None
+        score = None
+        try:
+            for depth in range(1, self.max_depth + 1):
+                score, action = self.aspiration_search(game, depth, score)
+                if action is not None:
+                    best_action = action
+                self.completed_depth = depth
+                if abs(score) >= 10000:
+                    break  # Forced win or loss: searching deeper won't change it
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        
+        if best_action is None:
+            # Not even depth 1 finished: fall back to the best-ordered action
+            actions = game.all_actions(game.turn)
+            if actions:
+                best_action = self.order_actions(game, actions)[0]
+        return best_action
+    
+    def search_subset(self, game, actions, max_depth, deadline=None):
+        """Iterative deepening over some root actions until `deadline` (a time.time() value).
+        
+        Returns ({depth: (score, action)} for each completed depth, forced, nodes) where forced means
+        the result was decided (win or loss) and deeper searches would not change it.
+        """
+        self.nodes = 0
+        if deadline is not None:
+            self.deadline = time.perf_counter() + (deadline - time.time())
+        
+        results = {}
+        forced = False
+        try:
+            for depth in range(1, max_depth + 1):
+                results[depth] = self.alphabeta(game, depth, float('-inf'), float('inf'), True,
+                                                root_actions=actions)
+                if abs(results[depth][0]) >= 10000:
+                    forced = True
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        return results, forced, self.nodes
+    
+    def parallel_search(self, game, time_budget_ms):
+        """Split the root actions across the process pool and combine the subtree results"""
+        actions = game.all_actions(game.turn)
+        if not actions:
+            return None
+        actions = self.order_actions(game, actions)
+        
+        # Deal actions round-robin so every worker gets some of the promising ones
+        chunks = [actions[i::self.parallel_workers] for i in range(self.parallel_workers)]
+        chunks = [chunk for chunk in chunks if chunk]
+        deadline = time.time() + time_budget_ms / 1000.0 if time_budget_ms else None
+        max_depth = self.max_depth if time_budget_ms else self.depth
+        
+        from concurrent.futures import wait
+        pool, pool_stop_event = get_process_pool(self.parallel_workers)
+        pool_stop_event.clear()
+        futures = [pool.submit(_search_root_subset, self, game, chunk, max_depth, deadline) for chunk in chunks]
+        
+        # Wait for the workers. If the search is cancelled, stop the jobs too (they check the pool's
+        # event like stop_event) so the next search doesn't queue behind them
+        pending = futures
+        while pending:
+            if self.stop_event is not None and self.stop_event.is_set():
+                pool_stop_event.set()
+                for future in pending:
+                    future.cancel()
+                wait(futures)
+                return None
+            _, pending = wait(pending, timeout=0.05)
+        results = [future.result() for future in futures]
+        
+        # Combine at the deepest depth every worker completed (decided subtrees count as any depth)
+        depth = min(max(r, default=0) if not forced else self.max_depth + 1 for r, forced, _ in results)
+        if depth > self.max_depth:
+            depth = max(max(r) for r, _, _ in results)
+        if depth == 0:
+            return actions[0]  # Not even depth 1 finished anywhere
+        
+        best_score, best_action = float('-inf'), None
+        for r, _, _ in results:
+            if not r:
+                continue
+            score, action = r[min(depth, max(r))]
+            if score > best_score:
+                best_score, best_action = score, action
+        self.completed_depth = depth
+        self.nodes = sum(nodes for _, _, nodes in results)
+        return best_action
+    
+    def think(self, game, time_budget_ms):
+        """Run the configured search on a position (hash must be current); returns the action"""
+        self.nodes = 0
+        self.completed_depth = 0
+        if self.use_alpha_beta and self.use_transposition_table:
+            if self.tt is None:
+                self.tt = TranspositionTable(self.tt_size_bits)
+            self.tt.new_search()
+        
+        if self.parallel_workers:
+            return self.parallel_search(game, time_budget_ms)
+        
+        game.track_eval_terms()
+        try:
+            if time_budget_ms:
+                return self.iterative_deepening(game, time_budget_ms)
+            
+            _, action = self.search(game, self.depth)
+            self.completed_depth = self.depth
+            return action
+        finally:
+            game.eval_terms = None  # Moves outside apply_action would leave them stale
+    
+    def choose_action(self, game, time_budget_ms=None, stop_event=None):
+        """Choose best action: iterative deepening within the time budget, else fixed-depth search.
+        
+        Setting stop_event (a threading.Event) cancels the search early.
+        """
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+        
+        game.compute_hash()  # Moves made outside do_action don't update the hash
+        
+        # Answer instantly if pondering already searched this position
+        pondered = self.ponder_results.get(game.position_key())
+        self.ponder_results = {}
+        if pondered is not None:
+            return pondered
+        
+        self.stop_event = stop_event
+        try:
+            return self.think(game, time_budget_ms)
+        except SearchTimeout:
+            return None  # Cancelled before the fixed-depth search finished
+        finally:
+            self.stop_event = None
+    
+    def ponder(self, game, stop_event):
+        """Search our replies to the opponent's likely actions while the opponent is thinking.
+        
+        `game` is a snapshot with the opponent to move. Each reply is searched with the normal
+        budget and kept by resulting position, so choose_action can answer instantly. Covers the
+        ponder_max_replies best-ordered replies within ponder_budget_ms in total, and stops early
+        when stop_event is set.
+        """
+        self.ponder_results = {}
+        game.compute_hash()
+        replies = self.order_actions(game, game.all_actions(game.turn))[:self.ponder_max_replies]
+        deadline = time.perf_counter() + self.ponder_budget_ms / 1000.0
+        
+        self.stop_event = stop_event
+        try:
+            for reply in replies:
+                if stop_event.is_set():
+                    break
+                if self.time_budget_ms and time.perf_counter() + self.time_budget_ms / 1000.0 > deadline:
+                    break  # No room left for a full-strength search of this reply
+                record = game.apply_action(*reply)
+                game.switch_turn()
+                try:
+                    if game.game_over:
+                        continue
+                    if not self.time_budget_ms:
+                        self.deadline = deadline  # Fixed depth: the ponder budget still caps the search
+                    action = self.think(game, self.time_budget_ms)
+                    if stop_event.is_set():
+                        break  # Interrupted: the result is from a shallower search
+                    self.ponder_results[game.position_key()] = action
+                finally:
+                    game.undo_action(record)
+        except SearchTimeout:
+            pass  # Stopped or out of ponder budget inside a fixed-depth search
+        finally:
+            self.stop_event = None
+            self.deadline = None
+    
+    def ponder_in_pool(self, game):
+        """Start ponder() in its own low-priority worker process, so it neither holds this process's
+        GIL nor takes a shared core from it.
+        
+        Returns (future, stop event): set the event to stop early, then store future.result() in
+        ponder_results before choosing the next action.
+        """
+        pool, stop_event = get_process_pool(1, niceness=PONDER_NICENESS)
+        stop_event.clear()
+        return pool.submit(_ponder_job, self, game), stop_event
+
+# Process pools for root-parallel search and pondering, kept alive between turns:
+# (workers, niceness) -> (pool, stop event)
+_process_pools = {}
+
+# Scheduling priority drop for the ponder process (Unix only)
+PONDER_NICENESS = 10
+
+def get_process_pool(workers, niceness=0):
+    """Shared process pool with `workers` processes and the event that stops its jobs (created on first use).
+    
+    Pools with a niceness run their processes at that lower priority (where os.nice exists).
+    """
+    entry = _process_pools.get((workers, niceness))
+    if entry is None:
+        # Imported here: engine-only users (no parallel search) don't pay for multiprocessing
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Spawn rather than fork: the UI process holds a window and an OpenGL context
+        context = multiprocessing.get_context('spawn')
+        # Events can't be pickled into job arguments, so the workers get it when they start
+        stop_event = context.Event()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_init_pool_worker, initargs=(stop_event, niceness))
+        # Shut the pool down at exit. A process that owns a pool (e.g. an arena game worker) joins
+        # its children before atexit handlers run, so this has to be a multiprocessing finalizer,
+        # ranked above the call queue's own finalizers (priority 10) so the queue is still open
+        multiprocessing.util.Finalize(pool, pool.shutdown, kwargs={"cancel_futures": True}, exitpriority=100)
+        entry = _process_pools[(workers, niceness)] = (pool, stop_event)
+    return entry
+
+# Transposition table and stop event a pool worker process keeps between jobs
+_pool_tt = None
+_pool_stop_event = None
+
+def _init_pool_worker(stop_event, niceness=0):
+    """Process pool initializer: keep the pool's stop event and lower the process priority"""
+    global _pool_stop_event
+    _pool_stop_event = stop_event
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)
+
+def _use_pool_table(ai):
+    """Give a job's AI player the worker's own transposition table"""
+    global _pool_tt
+    if ai.use_transposition_table:
+        if _pool_tt is None or _pool_tt.size != 1 << ai.tt_size_bits:
+            _pool_tt = TranspositionTable(ai.tt_size_bits)
+        ai.tt = _pool_tt
+        ai.tt.new_search()
+
+def _search_root_subset(ai, game, actions, max_depth, deadline):
+    """Process pool job: search some root actions with the worker's own transposition table"""
+    ai.stop_event = _pool_stop_event
+    _use_pool_table(ai)
+    game.compute_hash()
+    game.track_eval_terms()
+    return ai.search_subset(game, actions, max_depth, deadline)
+
+def _ponder_job(ai, game):
+    """Process pool job: ponder until the pool's stop event is set, returns the ponder results"""
+    _use_pool_table(ai)
+    ai.ponder(game, _pool_stop_event)
+    return ai.ponder_results
+
+class MCTSNode:
+    """Node of the search tree; wins are counted for the player whose action led here"""
+    __slots__ = ('action', 'parent', 'player', 'children', 'untried', 'visits', 'wins')
+    
+    def __init__(self, action, parent, player, untried):
+        self.action = action
+        self.parent = parent
+        self.player = player
+        self.children = []
+        self.untried = untried  # Actions not expanded yet
+        self.visits = 0
+        self.wins = 0.0
+    
+    def select_child(self, exploration):
+        """Child with the best UCT score"""
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits +
+                   exploration * math.sqrt(log_visits / child.visits))
+
+class MCTSPlayer:
+    """Monte Carlo Tree Search player (UCT selection, bitboard playouts); drop-in for AIPlayer"""
+    def __init__(self, player_id, god_manager=None, time_budget_ms=1500, iterations=None,
+                 exploration=1.4, playout_depth=40, heuristic_playouts=True):
+        self.player_id = player_id
+        self.god_manager = god_manager
+        self.time_budget_ms = time_budget_ms
+        self.iterations = iterations  # Iteration budget (used instead of time when set)
+        self.exploration = exploration
+        self.playout_depth = playout_depth  # Playouts longer than this count as draws
+        self.heuristic_playouts = heuristic_playouts  # Always take an immediate win in playouts and the tree
+        self.nodes = 0  # Iterations run by the last search
+    
+    def playout(self, game):
+        """Play random actions from the game position on a bitboard, return the winner (None = draw)"""
+        if game.game_over:
+            return game.winner
+        
+        bb = BitBoard.from_game(game)
+        for _ in range(self.playout_depth):
+            player = bb.turn
+            if self.heuristic_playouts and self.has_winning_move(bb, player):
+                return player
+            
+            actions = bb.all_actions(player)
+            if not actions:
+                return 1 - player  # No moves left: stalemated player loses
+            bb.apply_action(*random.choice(actions))
+            if bb.winner is not None:
+                return bb.winner
+            bb.turn = 1 - player
+        return None
+    
+    def has_winning_move(self, bb, player):
+        """Whether a worker can win right now (climb to level 3, or Pan dropping two levels)"""
+        for worker_id in (0, 1):
+            index = player * 2 + worker_id
+            moves = bb.moves_mask(index)
+            if not moves:
+                continue
+            targets = moves & bb.levels[3]
+            if bb.gods[player] == "Pan":
+                height = bb.heights[bb.squares[index]]
+                for level in range(0, height - 1):
+                    targets |= moves & bb.levels[level]
+            if targets:
+                return True
+        return False
+    
+    def choose_action(self, game, time_budget_ms=None, stop_event=None):
+        """Run MCTS iterations within the budget and return the most visited root action"""
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+        deadline = time.perf_counter() + time_budget_ms / 1000.0 if time_budget_ms else None
+        
+        # A win in one needs no search (random expansion can miss it on a small budget)
+        self.nodes = 0
+        winning_action = find_winning_action(game, game.turn)
+        if winning_action is not None:
+            return winning_action
+        
+        actions = game.all_actions(game.turn)
+        if not actions:
+            return None
+        root = MCTSNode(None, None, 1 - game.turn, actions)
+        
+        while True:
+            if self.iterations is not None:
+                if self.nodes >= self.iterations:
+                    break
+            elif deadline is None or time.perf_counter() >= deadline:
+                break
+            if stop_event is not None and stop_event.is_set():
+                break
+            self.nodes += 1
+            
+            # Selection: descend through fully expanded nodes
+            node = root
+            records = []
+            while not node.untried and node.children:
+                node = node.select_child(self.exploration)
+                records.append(game.apply_action(*node.action))
+                game.switch_turn()
+            
+            # Expansion: add one untried action
+            if node.untried:
+                action = node.untried.pop(random.randrange(len(node.untried)))
+                mover = game.turn
+                records.append(game.apply_action(*action))
+                game.switch_turn()
+                untried = []
+                if not game.game_over:
+                    # A side that can win takes the win, like in the playouts
+                    winning_action = find_winning_action(game, game.turn) if self.heuristic_playouts else None
+                    untried = [winning_action] if winning_action is not None else game.all_actions(game.turn)
+                child = MCTSNode(action, node, mover, untried)
+                node.children.append(child)
+                node = child
+            
+            # Simulation
+            if game.game_over:
+                winner = game.winner
+            elif not node.untried and not node.children:
+                winner = 1 - game.turn  # Side to move has no actions
+            else:
+                winner = self.playout(game)
+            
+            for record in reversed(records):
+                game.undo_action(record)
+            
+            # Backpropagation
+            while node is not None:
+                node.visits += 1
+                if winner is None:
+                    node.wins += 0.5
+                elif winner == node.player:
+                    node.wins += 1.0
+                node = node.parent
+        
+        if not root.children:
+            return actions[0]
+        return max(root.children, key=lambda child: child.visits).action
+    
+    def ponder(self, game, stop_event):
+        """Pondering is not supported: the tree is rebuilt every turn"""
+        pass
+
+# Placement opening book (built offline by build_opening_book.py, loaded on first use)
+OPENING_BOOK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets",
+                                 "opening_book.json")
+_opening_book = None
+
+def _symmetry(transform):
+    """Square permutation (square -> image square) for a transform of (col, row)"""
+    return [transform(square % 5, square // 5)[1] * 5 + transform(square % 5, square // 5)[0]
+            for square in range(25)]
+
+# The 8 symmetries of the board (rotations and reflections)
+PLACEMENT_SYMMETRIES = [
+    _symmetry(lambda c, r: (c, r)),
+    _symmetry(lambda c, r: (4 - r, c)),
+    _symmetry(lambda c, r: (4 - c, 4 - r)),
+    _symmetry(lambda c, r: (r, 4 - c)),
+    _symmetry(lambda c, r: (4 - c, r)),
+    _symmetry(lambda c, r: (c, 4 - r)),
+    _symmetry(lambda c, r: (r, c)),
+    _symmetry(lambda c, r: (4 - r, 4 - c)),
+]
+
+def placement_key(cells):
+    """Canonical book key for a placement and the symmetry that maps the position onto it.
+    
+    `cells` is a 25-character string (square = row * 5 + col): '.' empty, 'h' human, 'a' AI worker.
+    """
+    best_key, best_symmetry = None, None
+    for symmetry in PLACEMENT_SYMMETRIES:
+        image = [''] * 25
+        for square in range(25):
+            image[symmetry[square]] = cells[square]
+        key = ''.join(image)
+        if best_key is None or key < best_key:
+            best_key, best_symmetry = key, symmetry
+    return best_key, best_symmetry
+
+def load_opening_book(gods=(None, None)):
+    """Placement book {canonical key: square} for a god matchup (god names by player, None = no god).
+    
+    The file is read from disk once. Returns {} if it's missing or was searched for other gods.
+    """
+    global _opening_book
+    if _opening_book is None:
+        import json
+        try:
+            with open(OPENING_BOOK_PATH) as f:
+                data = json.load(f)
+            _opening_book = (tuple(data.get("gods", (None, None))), data["positions"])
+        except (OSError, ValueError, KeyError):
+            _opening_book = ((None, None), {})
+    book_gods, positions = _opening_book
+    return positions if book_gods == tuple(gods) else {}
+
+class Santorini:
+    def __init__(self, god_manager=None, ai_time_budget_ms=1500, ai_engine="minimax",
+                 ai_parallel_workers=0):  # FIXED - Added god_manager parameter
+        # Game board (5x5 grid, heights 0-4)
+        self.board = [[0 for _ in range(5)] for _ in range(5)]
+        
+        # Worker tracking
+        self.workers = []
+        self.occupants = [[None for _ in range(5)] for _ in range(5)]
+        
+        # Create workers (2 per player)
+        for player in [0, 1]:
+            for worker_id in [0, 1]:
+                self.workers.append(Worker(player, worker_id))
+        
+        # Game state
+        self.turn = 0  # 0 = human (red), 1 = AI (blue)
+        self.phase = 'placement'  # 'placement' or 'play'
+        self.is_ai_turn = False
+        self.game_over = False
+        self.winner = None
+        self.placed_workers = 0
+        
+        # God power integration
+        self.god_manager = god_manager
+        
+        # Zobrist hash of board, workers and turn (kept up to date by do_action)
+        self.zobrist_hash = EMPTY_BOARD_HASH
+        
+        # Per-worker (height, mobility, buildable neighbours) kept by apply_action/undo_action
+        self.eval_terms = None
+        
+        # AI player (with god manager): "minimax" (alpha-beta) or "mcts"
+        if ai_engine == "mcts":
+            self.ai = MCTSPlayer(player_id=1, god_manager=god_manager, time_budget_ms=ai_time_budget_ms)
+        else:
+            self.ai = AIPlayer(player_id=1, god_manager=god_manager, time_budget_ms=ai_time_budget_ms,
+                               parallel_workers=ai_parallel_workers)
+    
+    def place_worker_at(self, worker_index, col, row):
+        """Place a worker at the specified position during placement phase"""
+        if self.phase != 'placement':
+            return False
+        
+        # Check bounds and if cell is occupied
+        if not (0 <= col < 5 and 0 <= row < 5):
+            return False
+        if self.occupants[row][col] is not None:
+            return False
+        
+        # Get the worker to place
+        if worker_index < len(self.workers):
+            worker = self.workers[worker_index]
+            worker.x = col
+            worker.y = row
+            
+            # Update occupants grid
+            self.occupants[row][col] = worker
+            self.placed_workers += 1
+            
+            # Check if placement phase is complete
+            if self.placed_workers == 4:
+                self.phase = 'play'
+                self.is_ai_turn = (self.turn == 1)
+            
+            return True
+        
+        return False
+    
+    def get_worker_at(self, col, row):
+        """Get the worker at the specified position"""
+        if 0 <= col < 5 and 0 <= row < 5:
+            return self.occupants[row][col]
+        return None
+    
+    def possible_moves(self, worker):
+        """Get all valid move positions for a worker (with god power integration)"""
+        if worker.x is None or worker.y is None:
+            return []
+        
+        moves = []
+        current_height = self.board[worker.y][worker.x]
+        
+        # Check all 8 adjacent cells
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if dx == 0 and dy == 0:
+                    continue
+                
+                new_x = worker.x + dx
+                new_y = worker.y + dy
+                
+                # Check bounds
+                if not (0 <= new_x < 5 and 0 <= new_y < 5):
+                    continue
+                
+                # Check if occupied
+                if self.occupants[new_y][new_x] is not None:
+                    continue
+                
+                # Check height constraint (can't move up more than 1 level)
+                new_height = self.board[new_y][new_x]
+                if new_height > current_height + 1:
+                    continue
+                
+                # Check if there's a dome (height 4)
+                if new_height >= 4:
+                    continue
+                
+                # Check god power restrictions (e.g., Athena blocking upward movement)
+                if self.god_manager:
+                    opponent_god = self.god_manager.get_god_for_player(1 - worker.owner)
+                    if opponent_god and opponent_god.name == "Athena":
+                        if hasattr(opponent_god, 'opponent_cant_move_up') and opponent_god.opponent_cant_move_up:
+                            if new_height > current_height:
+                                continue
+                
+                # Check if god power allows this move
+                if self.god_manager and not self.god_manager.can_move(self, worker, (new_x, new_y)):
+                    continue
+                
+                moves.append((new_x, new_y))
+        
+        return moves
+    
+    def possible_builds(self, worker):
+        """Get all valid build positions for a worker (with god power integration)"""
+        if worker.x is None or worker.y is None:
+            return []
+        
+        builds = []
+        
+        # Check all 8 adjacent cells
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if dx == 0 and dy == 0:
+                    continue
+                
+                new_x = worker.x + dx
+                new_y = worker.y + dy
+                
+                # Check bounds
+                if not (0 <= new_x < 5 and 0 <= new_y < 5):
+                    continue
+                
+                # Check if occupied
+                if self.occupants[new_y][new_x] is not None:
+                    continue
+                
+                # Check if already at max height (4 = dome)
+                if self.board[new_y][new_x] >= 4:
+                    continue
+                
+                # Check if god power allows this build
+                if self.god_manager and not self.god_manager.can_build(self, worker, (new_x, new_y)):
+                    continue
+                
+                builds.append((new_x, new_y))
+        
+        return builds
+    
+    def has_won(self, worker):
+        """Check if a worker has won by reaching height 3 (normal win condition)"""
+        if worker.x is None or worker.y is None:
+            return False
+        return self.board[worker.y][worker.x] == 3
+    
+    def get_player_workers(self, player):
+        """Get all workers belonging to a player"""
+        return [w for w in self.workers if w.owner == player]
+    
+    def __getstate__(self):
+        """Pickle without the AI player (process pool jobs get it separately)"""
+        state = self.__dict__.copy()
+        state['ai'] = None
+        return state
+    
+    def compute_hash(self):
+        """Recompute the Zobrist hash of board heights, worker squares and turn from scratch"""
+        h = 0
+        for row in range(5):
+            for col in range(5):
+                h ^= ZOBRIST_HEIGHT[row * 5 + col][self.board[row][col]]
+        for worker in self.workers:
+            if worker.x is not None:
+                h ^= ZOBRIST_WORKER[worker.owner * 2 + worker.worker_id][worker.y * 5 + worker.x]
+        if self.turn == 1:
+            h ^= ZOBRIST_TURN
+        self.zobrist_hash = h
+        return h
+    
+    def god_hash(self):
+        """Zobrist hash of the god power state that affects future moves, builds and wins"""
+        if not self.god_manager:
+            return 0
+        
+        h = 0
+        for player in (0, 1):
+            god = self.god_manager.get_god_for_player(player)
+            if god is None:
+                continue
+            if god.name == "Athena":
+                if god.blocked_player is not None:
+                    h ^= ZOBRIST_ATHENA[god.blocked_player]
+            elif god.name == "Demeter":
+                if god.can_build_second and god.current_worker is not None:
+                    bx, by = god.first_build_pos
+                    index = god.current_worker.owner * 2 + god.current_worker.worker_id
+                    h ^= ZOBRIST_DEMETER[index][by * 5 + bx]
+            elif god.name == "Pan":
+                for worker in self.get_player_workers(player):
+                    h ^= ZOBRIST_PAN[worker.owner * 2 + worker.worker_id][min(worker.previous_height, 4)]
+        return h
+    
+    def position_key(self):
+        """Transposition table key: incremental hash plus the current god power state"""
+        return self.zobrist_hash ^ self.god_hash()
+    
+    def switch_turn(self):
+        """Pass the turn to the other player (keeps the hash in sync)"""
+        self.turn = 1 - self.turn
+        self.zobrist_hash ^= ZOBRIST_TURN
+    
+    def is_losing_position(self, player):
+        """Check if player has no valid moves (losing position)"""
+        my_workers = self.get_player_workers(player)
+        return not any(self.possible_moves(w) for w in my_workers if w.x is not None)
+    
+    def clone(self):
+        """Create a deep copy of the current game state"""
+        new_game = Santorini(self.god_manager)
+        new_game.board = copy.deepcopy(self.board)
+        new_game.occupants = [[None for _ in range(5)] for _ in range(5)]
+        new_game.workers = []
+        
+        # Copy workers and update occupants
+        for worker in self.workers:
+            new_worker = Worker(worker.owner, worker.worker_id, worker.x, worker.y)
+            new_worker.previous_height = getattr(worker, 'previous_height', 0)
+            new_game.workers.append(new_worker)
+            if worker.x is not None and worker.y is not None:
+                new_game.occupants[worker.y][worker.x] = new_worker
+        
+        new_game.turn = self.turn
+        new_game.phase = self.phase
+        new_game.is_ai_turn = self.is_ai_turn
+        new_game.game_over = self.game_over
+        new_game.winner = self.winner
+        new_game.placed_workers = self.placed_workers
+        new_game.zobrist_hash = self.zobrist_hash
+        
+        return new_game
+    
+    def snapshot(self):
+        """Independent copy (with its own god power state) that can be searched on another thread.
+        
+        The copy shares this game's AI player so its transposition table stays warm.
+        """
+        game = self.clone()
+        if self.god_manager:
+            worker_map = dict(zip(self.workers, game.workers))
+            game.god_manager = self.god_manager.clone(worker_map)
+        game.ai = self.ai
+        return game
+    
+    def all_actions(self, player):
+        """Generate all possible actions for a player (with god power integration)"""
+        actions = []
+        my_workers = self.get_player_workers(player)
+        
+        for worker in my_workers:
+            if worker.x is None:
+                continue
+            
+            for move in self.possible_moves(worker):
+                # Temporarily move worker to new position
+                old_x, old_y = worker.x, worker.y
+                worker.x, worker.y = move
+                
+                # Get possible builds from new position
+                for build in self.possible_builds(worker):
+                    actions.append((worker.worker_id, move, build))
+                
+                # Restore original position
+                worker.x, worker.y = old_x, old_y
+        
+        return actions
+    
+    def do_action(self, worker_id, move, build):
+        """Execute an action: move worker, then build (with god power integration)"""
+        my_workers = self.get_player_workers(self.turn)
+        worker = next(w for w in my_workers if w.worker_id == worker_id)
+        
+        # Store old position for god power effects
+        old_pos = (worker.x, worker.y)
+        worker.previous_height = self.board[worker.y][worker.x]
+        
+        # Move worker
+        worker_keys = ZOBRIST_WORKER[worker.owner * 2 + worker.worker_id]
+        self.zobrist_hash ^= worker_keys[worker.y * 5 + worker.x] ^ worker_keys[move[1] * 5 + move[0]]
+        self.occupants[worker.y][worker.x] = None
+        worker.x, worker.y = move
+        self.occupants[worker.y][worker.x] = worker
+        
+        # Trigger god power on_move
+        if self.god_manager:
+            self.god_manager.on_move(self, worker, old_pos, move)
+        
+        # Check for win after move (normal + god power wins)
+        if self.has_won(worker) or (self.god_manager and self.god_manager.check_special_win(self, worker)):
+            self.game_over = True
+            self.winner = worker.owner
+            return
+        
+        # Build
+        build_x, build_y = build
+        height_keys = ZOBRIST_HEIGHT[build_y * 5 + build_x]
+        self.zobrist_hash ^= height_keys[self.board[build_y][build_x]] ^ height_keys[self.board[build_y][build_x] + 1]
+        self.board[build_y][build_x] += 1
+        
+        # Trigger god power on_build
+        if self.god_manager:
+            self.god_manager.on_build(self, worker, build)
+    
+    def apply_action(self, worker_id, move, build):
+        """Play an action in place like do_action and return an undo record for undo_action"""
+        worker = self.workers[self.turn * 2 + worker_id]
+        god_state = self.god_manager.get_state() if self.god_manager else None
+        old_square = worker.y * 5 + worker.x
+        record = [worker, worker.x, worker.y, worker.previous_height, None, god_state,
+                  self.game_over, self.winner, self.zobrist_hash, self.turn, self.eval_terms]
+        
+        self.do_action(worker_id, move, build)
+        
+        # A winning move ends the turn before the build
+        if not self.game_over:
+            record[4] = build
+        
+        if self.eval_terms is not None:
+            self.eval_terms = list(self.eval_terms)  # The record keeps the old terms
+            changed = [old_square, move[1] * 5 + move[0]]
+            if record[4] is not None:
+                changed.append(build[1] * 5 + build[0])
+            self.update_eval_terms(changed)
+        return record
+    
+    def undo_action(self, record):
+        """Take back an action played with apply_action"""
+        (worker, old_x, old_y, previous_height, build, god_state,
+         game_over, winner, zobrist_hash, turn, eval_terms) = record
+        
+        if build is not None:
+            self.board[build[1]][build[0]] -= 1
+        
+        self.occupants[worker.y][worker.x] = None
+        worker.x, worker.y = old_x, old_y
+        self.occupants[old_y][old_x] = worker
+        worker.previous_height = previous_height
+        
+        if god_state is not None:
+            self.god_manager.set_state(god_state)
+        
+        self.game_over = game_over
+        self.winner = winner
+        self.zobrist_hash = zobrist_hash
+        self.turn = turn
+        self.eval_terms = eval_terms
+    
+    def worker_eval_terms(self, worker):
+        """(height, legal moves, buildable neighbours) of a worker, the inputs of AIPlayer.evaluate"""
+        if worker.x is None:
+            return (0, 0, 0)
+        
+        # God power move checks are only needed if a god can forbid moves
+        check_gods = False
+        if self.god_manager:
+            own_god = self.god_manager.get_god_for_player(worker.owner)
+            opponent_god = self.god_manager.get_god_for_player(1 - worker.owner)
+            check_gods = ((own_god is not None and own_god.can_restrict_moves) or
+                          (opponent_god is not None and opponent_god.name == "Athena"))
+        
+        board = self.board
+        occupants = self.occupants
+        height = board[worker.y][worker.x]
+        moves = 0
+        builds = 0
+        for square in NEIGHBOR_SQUARES[worker.y * 5 + worker.x]:
+            col, row = SQUARE_COORDS[square]
+            if occupants[row][col] is not None or board[row][col] >= 4:
+                continue
+            builds += 1
+            if board[row][col] <= height + 1 and (not check_gods or _can_step(self, worker, col, row, height)):
+                moves += 1
+        return (height, moves, builds)
+    
+    def track_eval_terms(self):
+        """Compute every worker's evaluation terms; apply_action/undo_action keep them up to date"""
+        self.eval_terms = [self.worker_eval_terms(w) for w in self.workers]
+    
+    def update_eval_terms(self, changed_squares):
+        """Recompute the terms of workers standing on or next to squares whose height or occupant changed"""
+        affected = 0
+        for changed in changed_squares:
+            affected |= NEIGHBOR_MASKS[changed] | (1 << changed)
+        for index, worker in enumerate(self.workers):
+            if worker.x is not None and affected >> (worker.y * 5 + worker.x) & 1:
+                self.eval_terms[index] = self.worker_eval_terms(worker)
+    
+    def ai_get_best_move(self, stop_event=None):
+        """AI decision making using minimax with god powers"""
+        if self.phase == 'placement':
+            return self.ai_placement_move()
+        else:
+            return self.ai_play_move(stop_event)
+    
+    def placement_cells(self):
+        """Worker layout as a 25-character string: '.' empty, 'h' human, 'a' AI (see placement_key)"""
+        cells = ['.'] * 25
+        for worker in self.workers:
+            if worker.x is not None:
+                cells[worker.y * 5 + worker.x] = 'h' if worker.owner == 0 else 'a'
+        return ''.join(cells)
+    
+    def ai_placement_move(self):
+        """AI placement strategy"""
+        available_cells = []
+        for row in range(5):
+            for col in range(5):
+                if self.occupants[row][col] is None:
+                    available_cells.append((col, row))
+        
+        if not available_cells:
+            return None
+        
+        # Opening book lookup (one entry covers all 8 symmetric placements), for its own god matchup only
+        gods = (None, None)
+        if self.god_manager:
+            gods = tuple(god.name if god else None for god in
+                         (self.god_manager.get_god_for_player(0), self.god_manager.get_god_for_player(1)))
+        key, symmetry = placement_key(self.placement_cells())
+        book_square = load_opening_book(gods).get(key)
+        if book_square is not None:
+            square = symmetry.index(book_square)  # Map back from the canonical orientation
+            cell = (square % 5, square // 5)
+            if cell in available_cells:
+                return cell
+        
+        # Priority: center > corners > edges
+        center_cells = [(2, 2), (1, 2), (3, 2), (2, 1), (2, 3)]
+        corner_cells = [(0, 0), (0, 4), (4, 0), (4, 4)]
+        
+        for priority_cells in [center_cells, corner_cells]:
+            for cell in priority_cells:
+                if cell in available_cells:
+                    return cell
+        
+        return random.choice(available_cells)
+    
+    def ai_play_move(self, stop_event=None):
+        """AI play phase using minimax with god powers"""
+        action = self.ai.choose_action(self, stop_event=stop_event)
+        if not action:
+            return None
+        
+        worker_id, move, build = action
+        
+        # Find the actual worker object
+        my_workers = self.get_player_workers(1)  # AI is player 1
+        worker = next(w for w in my_workers if w.worker_id == worker_id)
+        
+        return (worker, move, build)
+    
+    def execute_move(self, worker, move_pos, build_pos=None):
+        """Execute a move (used by both human and AI) with god power integration"""
+        # Store old position for god power effects
+        old_pos = (worker.x, worker.y) if worker.x is not None else None
+        if old_pos:
+            worker.previous_height = self.board[old_pos[1]][old_pos[0]]
+        
+        # Clear old position
+        if worker.x is not None:
+            self.occupants[worker.y][worker.x] = None
+        
+        # Make move
+        worker.x, worker.y = move_pos
+        self.occupants[move_pos[1]][move_pos[0]] = worker
+        
+        # Trigger god power on_move
+        if self.god_manager and old_pos:
+            self.god_manager.on_move(self, worker, old_pos, move_pos)
+        
+        # Check for win after move (normal + god power wins)
+        if self.has_won(worker) or (self.god_manager and self.god_manager.check_special_win(self, worker)):
+            self.game_over = True
+            self.winner = worker.owner
+            return True
+        
+        # If build position provided, execute build
+        if build_pos is not None:
+            self.board[build_pos[1]][build_pos[0]] += 1
+            
+            # Trigger god power on_build
+            if self.god_manager:
+                self.god_manager.on_build(self, worker, build_pos)
+            
+            # Switch turns only if game hasn't ended
+            if not self.game_over:
+                self.turn = 1 - self.turn
+                self.is_ai_turn = (self.turn == 1)
+        
+        return False  # Game continues
+
+# Bitboard geometry: square = row * 5 + col, bit = 1 << square
+BOARD_MASK = (1 << 25) - 1
+
+def _neighbor_mask(square):
+    """Mask of the (up to 8) squares adjacent to a square"""
+    col, row = square % 5, square // 5
+    mask = 0
+    for dx in [-1, 0, 1]:
+        for dy in [-1, 0, 1]:
+            if (dx or dy) and 0 <= col + dx < 5 and 0 <= row + dy < 5:
+                mask |= 1 << ((row + dy) * 5 + col + dx)
+    return mask
+
+NEIGHBOR_MASKS = [_neighbor_mask(square) for square in range(25)]
+SQUARE_COORDS = [(square % 5, square // 5) for square in range(25)]  # square -> (col, row)
+
+def iter_squares(mask):
+    """Yield the square index of every set bit in a mask"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class BitBoard:
+    """Integer-mask game state: one 25-bit mask per height level plus one occupancy mask per player.
+    
+    Follows the same rules as Santorini (including the god powers implemented in gods.py) so
+    move generation runs as bitwise operations. Convert with from_game() and to_game().
+    """
+    def __init__(self):
+        self.levels = [BOARD_MASK, 0, 0, 0, 0]  # levels[h] = squares of height exactly h (4 = dome)
+        self.heights = [0] * 25  # Same heights by square, for O(1) lookups
+        self.occupied = [0, 0]  # Worker squares per player
+        self.squares = [None, None, None, None]  # Square of each worker (owner * 2 + worker_id)
+        self.previous_heights = [0, 0, 0, 0]
+        self.turn = 0
+        self.winner = None
+        
+        # God power state (names as in gods.py), one slot per player: both sides may have the same god
+        self.gods = [None, None]
+        self.athena_blocked = [None, None]  # Athena.blocked_player
+        self.artemis_from = [None, None]  # (worker index, square) Artemis may not move back to
+        self.demeter_pending = [None, None]  # (worker index, square) of Demeter's pending second build
+    
+    @classmethod
+    def from_game(cls, game):
+        """Build a bitboard from a Santorini game"""
+        bb = cls()
+        for row in range(5):
+            for col in range(5):
+                height = game.board[row][col]
+                if height:
+                    bit = 1 << (row * 5 + col)
+                    bb.levels[0] ^= bit
+                    bb.levels[height] |= bit
+                    bb.heights[row * 5 + col] = height
+        
+        for index, worker in enumerate(game.workers):
+            bb.previous_heights[index] = worker.previous_height
+            if worker.x is not None:
+                square = worker.y * 5 + worker.x
+                bb.squares[index] = square
+                bb.occupied[worker.owner] |= 1 << square
+        bb.turn = game.turn
+        bb.winner = game.winner
+        
+        if game.god_manager:
+            for player in (0, 1):
+                god = game.god_manager.get_god_for_player(player)
+                if god is None:
+                    continue
+                bb.gods[player] = god.name
+                if god.name == "Athena":
+                    bb.athena_blocked[player] = god.blocked_player
+                elif god.name == "Artemis" and god.has_first_move and god.current_worker in game.workers:
+                    col, row = god.first_move_from
+                    bb.artemis_from[player] = (game.workers.index(god.current_worker), row * 5 + col)
+                elif god.name == "Demeter" and god.can_build_second and god.current_worker in game.workers:
+                    col, row = god.first_build_pos
+                    bb.demeter_pending[player] = (game.workers.index(god.current_worker), row * 5 + col)
+        return bb
+    
+    def to_game(self, god_manager=None):
+        """Build a Santorini game from this bitboard (god state is copied onto god_manager's gods)"""
+        game = Santorini(god_manager)
+        for square in range(25):
+            col, row = SQUARE_COORDS[square]
+            game.board[row][col] = self.heights[square]
+        
+        for index, worker in enumerate(game.workers):
+            worker.previous_height = self.previous_heights[index]
+            if self.squares[index] is not None:
+                worker.x, worker.y = SQUARE_COORDS[self.squares[index]]
+                game.occupants[worker.y][worker.x] = worker
+                game.placed_workers += 1
+        if game.placed_workers == 4:
+            game.phase = 'play'
+        game.turn = self.turn
+        game.is_ai_turn = (game.turn == 1)
+        game.winner = self.winner
+        game.game_over = self.winner is not None
+        
+        if god_manager:
+            for player in (0, 1):
+                god = god_manager.get_god_for_player(player)
+                if god is None or god.name != self.gods[player]:
+                    continue
+                if god.name == "Athena":
+                    god.blocked_player = self.athena_blocked[player]
+                elif god.name == "Artemis":
+                    if self.artemis_from[player]:
+                        index, square = self.artemis_from[player]
+                        god.set_state((True, SQUARE_COORDS[square], game.workers[index]))
+                    else:
+                        god.set_state((False, None, None))
+                elif god.name == "Demeter":
+                    if self.demeter_pending[player]:
+                        index, square = self.demeter_pending[player]
+                        god.set_state((SQUARE_COORDS[square], True, game.workers[index]))
+                    else:
+                        god.set_state((None, False, None))
+        game.compute_hash()
+        return game
+    
+    def height(self, square):
+        """Height of a square (4 = dome)"""
+        return self.heights[square]
+    
+    def moves_mask(self, index):
+        """Mask of squares worker `index` (owner * 2 + worker_id) can move to"""
+        square = self.squares[index]
+        if square is None:
+            return 0
+        
+        player = index >> 1
+        levels = self.levels
+        height = self.heights[square]
+        
+        # Athena blocks her own player from climbing while blocked_player is set to them
+        max_height = height
+        if not (self.gods[player] == "Athena" and self.athena_blocked[player] == player):
+            max_height = min(height + 1, 3)
+        reachable = levels[0]
+        for level in range(1, max_height + 1):
+            reachable |= levels[level]
+        
+        mask = NEIGHBOR_MASKS[square] & reachable & ~(self.occupied[0] | self.occupied[1])
+        artemis_from = self.artemis_from[player]
+        if artemis_from is not None and artemis_from[0] == index:
+            mask &= ~(1 << artemis_from[1])
+        return mask
+    
+    def builds_mask(self, index, from_square, to_square):
+        """Mask of squares worker `index` can build on after moving from_square -> to_square.
+        
+        Like Santorini.all_actions, the vacated square still counts as occupied.
+        """
+        mask = NEIGHBOR_MASKS[to_square] & ~(self.occupied[0] | self.occupied[1] | self.levels[4])
+        demeter_pending = self.demeter_pending[index >> 1]
+        if demeter_pending is not None and demeter_pending[0] == index:
+            mask &= ~(1 << demeter_pending[1])
+        return mask
+    
+    def all_actions(self, player):
+        """All (worker_id, move, build) actions for a player, same format as Santorini.all_actions"""
+        actions = []
+        for worker_id in (0, 1):
+            index = player * 2 + worker_id
+            from_square = self.squares[index]
+            if from_square is None:
+                continue
+            for to_square in iter_squares(self.moves_mask(index)):
+                move = SQUARE_COORDS[to_square]
+                for build_square in iter_squares(self.builds_mask(index, from_square, to_square)):
+                    actions.append((worker_id, move, SQUARE_COORDS[build_square]))
+        return actions
+    
+    def count_actions(self, player):
+        """Number of actions for a player without building the action list"""
+        count = 0
+        for worker_id in (0, 1):
+            index = player * 2 + worker_id
+            from_square = self.squares[index]
+            if from_square is None:
+                continue
+            for to_square in iter_squares(self.moves_mask(index)):
+                count += self.builds_mask(index, from_square, to_square).bit_count()
+        return count
+    
+    def apply_action(self, worker_id, move, build):
+        """Play an action in place (move, win check, build) and return an undo record.
+        
+        The record holds only what the action changes (the mover's god state and the squares
+        involved), so undo_action reverses it without copying the masks.
+        """
+        player = self.turn
+        index = player * 2 + worker_id
+        heights = self.heights
+        
+        # Move
+        from_square = self.squares[index]
+        to_square = move[1] * 5 + move[0]
+        old_height = heights[from_square]
+        new_height = heights[to_square]
+        record = [index, from_square, to_square, self.previous_heights[index], self.athena_blocked[player],
+                  self.artemis_from[player], self.demeter_pending[player], self.winner, None]
+        self.previous_heights[index] = old_height
+        self.occupied[player] ^= (1 << from_square) | (1 << to_square)
+        self.squares[index] = to_square
+        
+        god = self.gods[player]
+        if god == "Athena":
+            self.athena_blocked[player] = 1 - player if new_height > old_height else None
+        elif god == "Artemis":
+            artemis_from = self.artemis_from[player]
+            if artemis_from is None or artemis_from[0] != index:
+                self.artemis_from[player] = (index, from_square)
+            else:
+                self.artemis_from[player] = None
+        
+        # Win after move (normal + Pan)
+        if new_height == 3 or (god == "Pan" and old_height - new_height >= 2):
+            self.winner = player
+            return record
+        
+        # Build
+        build_square = build[1] * 5 + build[0]
+        bit = 1 << build_square
+        height = heights[build_square]
+        self.levels[height] ^= bit
+        self.levels[height + 1] |= bit
+        heights[build_square] = height + 1
+        record[8] = build_square
+        
+        if god == "Artemis":
+            self.artemis_from[player] = None
+        elif god == "Demeter":
+            demeter_pending = self.demeter_pending[player]
+            if demeter_pending is None or demeter_pending[0] != index:
+                self.demeter_pending[player] = (index, build_square)
+            else:
+                self.demeter_pending[player] = None
+        return record
+    
+    def undo_action(self, record):
+        """Take back an action played with apply_action"""
+        index, from_square, to_square, previous_height, athena_blocked, artemis_from, demeter_pending, winner, \
+            build_square = record
+        player = index >> 1
+        if build_square is not None:
+            bit = 1 << build_square
+            height = self.heights[build_square] - 1
+            self.levels[height + 1] ^= bit
+            self.levels[height] |= bit
+            self.heights[build_square] = height
+        self.occupied[player] ^= (1 << from_square) | (1 << to_square)
+        self.squares[index] = from_square
+        self.previous_heights[index] = previous_height
+        self.athena_blocked[player] = athena_blocked
+        self.artemis_from[player] = artemis_from
+        self.demeter_pending[player] = demeter_pending
+        self.winner = winner
+
+NEIGHBOR_SQUARES = [list(iter_squares(mask)) for mask in NEIGHBOR_MASKS]  # square -> adjacent squares
+
+# Threat detection: tactical questions answered from adjacency and heights, without generating
+# every action. Results match Santorini.possible_moves/all_actions, god powers included.
+
+def _can_step(game, worker, col, row, current_height):
+    """Whether worker may move onto (col, row); the same checks as Santorini.possible_moves"""
+    if game.occupants[row][col] is not None:
+        return False
+    new_height = game.board[row][col]
+    if new_height > current_height + 1 or new_height >= 4:
+        return False
+    
+    god_manager = game.god_manager
+    if god_manager:
+        opponent_god = god_manager.get_god_for_player(1 - worker.owner)
+        if opponent_god and opponent_god.name == "Athena":
+            if getattr(opponent_god, 'opponent_cant_move_up', False) and new_height > current_height:
+                return False
+        if not god_manager.can_move(game, worker, (col, row)):
+            return False
+    return True
+
+def _first_build(game, worker, col, row):
+    """A square the worker can build on after moving to (col, row) (as in all_actions), or None"""
+    god_manager = game.god_manager
+    for square in NEIGHBOR_SQUARES[row * 5 + col]:
+        build_col, build_row = SQUARE_COORDS[square]
+        if game.occupants[build_row][build_col] is not None or game.board[build_row][build_col] >= 4:
+            continue
+        if god_manager and not god_manager.can_build(game, worker, (build_col, build_row)):
+            continue
+        return (build_col, build_row)
+    return None
+
+def _winning_targets(game, worker, is_pan):
+    """Adjacent squares the worker would win on by moving there (level 3, or Pan dropping two levels)"""
+    height = game.board[worker.y][worker.x]
+    if height < 2:
+        return
+    for square in NEIGHBOR_SQUARES[worker.y * 5 + worker.x]:
+        col, row = SQUARE_COORDS[square]
+        target = game.board[row][col]
+        if target == 3 or (is_pan and height - target >= 2):
+            if _can_step(game, worker, col, row, height):
+                yield col, row
+
+def _is_pan(game, player):
+    god = game.god_manager.get_god_for_player(player) if game.god_manager else None
+    return god is not None and god.name == "Pan"
+
+def find_winning_action(game, player):
+    """An action that wins this turn for `player`, or None"""
+    is_pan = _is_pan(game, player)
+    for worker in game.get_player_workers(player):
+        if worker.x is None:
+            continue
+        for col, row in _winning_targets(game, worker, is_pan):
+            # all_actions only lists moves that are followed by a legal build
+            build = _first_build(game, worker, col, row)
+            if build is not None:
+                return (worker.worker_id, (col, row), build)
+    return None
+
+def climb_threats(game, player):
+    """Squares `player` could win on if it were their move (what the other side must block)"""
+    threats = set()
+    is_pan = _is_pan(game, player)
+    for worker in game.get_player_workers(player):
+        if worker.x is not None:
+            threats.update(_winning_targets(game, worker, is_pan))
+    return threats
+
+def must_block(game):
+    """The opponent's winning squares that the side to move has to block now (empty if none)"""
+    return climb_threats(game, 1 - game.turn)
+
+def is_stalemated(game, player):
+    """Whether none of the player's workers can move (same answer as is_losing_position)"""
+    for worker in game.get_player_workers(player):
+        if worker.x is None:
+            continue
+        height = game.board[worker.y][worker.x]
+        for square in NEIGHBOR_SQUARES[worker.y * 5 + worker.x]:
+            col, row = SQUARE_COORDS[square]
+            if _can_step(game, worker, col, row, height):
+                return False
+    return True
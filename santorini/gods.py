@@ -0,0 +1,390 @@
+"""God power rules: the GodPower base class, the six gods, GodPowerManager and create_god.
+
+Display code (card sprites, selection screen) lives in the top-level gods.py.
+"""
+from abc import ABC, abstractmethod
+
+class GodPower(ABC):
+    """Base class for all God Powers"""
+    # True if can_move may refuse a move (lets the engine skip the check otherwise)
+    can_restrict_moves = False
+    
+    def __init__(self, name, description, image_path):
+        self.name = name
+        self.description = description
+        self.image_path = image_path
+        self.is_active = False
+        
+    def get_state(self):
+        """Snapshot of the mutable rule state (used to undo simulated moves)"""
+        return None
+    
+    def set_state(self, state):
+        """Restore rule state captured by get_state"""
+        pass
+    
+    def clone(self, worker_map=None):
+        """New instance with the same rule state; worker_map remaps Worker references"""
+        god = type(self)()
+        state = self.get_state()
+        if worker_map and isinstance(state, tuple):
+            state = tuple(worker_map.get(value, value) for value in state)
+        god.set_state(state)
+        return god
+        
+    @abstractmethod
+    def can_move(self, game, worker, target_pos):
+        """Override movement rules"""
+        return True
+        
+    @abstractmethod
+    def can_build(self, game, worker, target_pos):
+        """Override building rules"""
+        return True
+        
+    @abstractmethod
+    def on_move(self, game, worker, old_pos, new_pos):
+        """Triggered after a move"""
+        pass
+        
+    @abstractmethod
+    def on_build(self, game, worker, build_pos):
+        """Triggered after a build"""
+        pass
+        
+    @abstractmethod
+    def has_won(self, game, worker):
+        """Override win conditions"""
+        return False
+
+# God Power Implementations with ACTIVE LOGIC
+
+class Pan(GodPower):
+    """Also wins by jumping down 2 levels"""
+    def __init__(self):
+        super().__init__(
+            "Pan", 
+            "You also win by jumping down 2 levels.",
+            "assets/gods/pan.png"
+        )
+        
+    def can_move(self, game, worker, target_pos):
+        return True  # Normal movement rules
+        
+    def can_build(self, game, worker, target_pos):
+        return True  # Normal building rules
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        # Store previous height for win condition check
+        if old_pos:
+            worker.previous_height = game.board[old_pos[1]][old_pos[0]]
+        
+    def on_build(self, game, worker, build_pos):
+        pass
+        
+    def has_won(self, game, worker):
+        # ACTIVE: Check if worker moved down 2+ levels
+        if hasattr(worker, 'previous_height') and worker.x is not None:
+            current_height = game.board[worker.y][worker.x]
+            if worker.previous_height - current_height >= 2:
+                return True
+        return False
+
+class Atlas(GodPower):
+    """Build domes as if they were blocks"""
+    def __init__(self):
+        super().__init__(
+            "Atlas",
+            "Build domes as if they were blocks.",
+            "assets/gods/atlas.png"
+        )
+        
+    def can_move(self, game, worker, target_pos):
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        # ACTIVE: Can build domes at any level (not just level 3)
+        x, y = target_pos
+        if game.board[y][x] >= 4 or game.occupants[y][x] is not None:
+            return False
+        return True  # Atlas can build domes anywhere
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        pass
+        
+    def on_build(self, game, worker, build_pos):
+        pass
+        
+    def has_won(self, game, worker):
+        return False
+
+class Artemis(GodPower):
+    """May move a builder twice before building"""
+    can_restrict_moves = True
+    
+    def __init__(self):
+        super().__init__(
+            "Artemis",
+            "You may move a builder twice before building.",
+            "assets/gods/artemis.png"
+        )
+        self.has_first_move = False
+        self.first_move_from = None
+        self.current_worker = None
+        
+    def get_state(self):
+        return (self.has_first_move, self.first_move_from, self.current_worker)
+        
+    def set_state(self, state):
+        self.has_first_move, self.first_move_from, self.current_worker = state
+        
+    def can_move(self, game, worker, target_pos):
+        # ACTIVE: Can't return to starting position on second move
+        if (self.has_first_move and 
+            self.current_worker == worker and 
+            target_pos == self.first_move_from):
+            return False
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        return True
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        # ACTIVE: Track double move
+        if not self.has_first_move or self.current_worker != worker:
+            self.first_move_from = old_pos
+            self.has_first_move = True
+            self.current_worker = worker
+        else:
+            # Second move completed
+            self.has_first_move = False
+            self.first_move_from = None
+            self.current_worker = None
+        
+    def on_build(self, game, worker, build_pos):
+        # Reset after building
+        self.has_first_move = False
+        self.first_move_from = None
+        self.current_worker = None
+        
+    def has_won(self, game, worker):
+        return False
+
+class Demeter(GodPower):
+    """Build an additional block on a different space than the first block"""
+    def __init__(self):
+        super().__init__(
+            "Demeter",
+            "Build an additional block on a different space than the first block.",
+            "assets/gods/demeter.png"
+        )
+        self.first_build_pos = None
+        self.can_build_second = False
+        self.current_worker = None
+        
+    def get_state(self):
+        return (self.first_build_pos, self.can_build_second, self.current_worker)
+        
+    def set_state(self, state):
+        self.first_build_pos, self.can_build_second, self.current_worker = state
+        
+    def can_move(self, game, worker, target_pos):
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        # ACTIVE: Second build can't be on same space as first
+        if (self.can_build_second and 
+            self.current_worker == worker and 
+            target_pos == self.first_build_pos):
+            return False
+        return True
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        pass
+        
+    def on_build(self, game, worker, build_pos):
+        # ACTIVE: Track double build
+        if not self.can_build_second or self.current_worker != worker:
+            self.first_build_pos = build_pos
+            self.can_build_second = True
+            self.current_worker = worker
+        else:
+            # Second build completed
+            self.can_build_second = False
+            self.first_build_pos = None
+            self.current_worker = None
+            
+    def has_won(self, game, worker):
+        return False
+
+class Athena(GodPower):
+    """After stepping up a level, no other builders may step up a level until your next turn"""
+    can_restrict_moves = True
+    
+    def __init__(self):
+        super().__init__(
+            "Athena",
+            "After stepping up a level, no other builders may step up a level until your next turn.",
+            "assets/gods/athena.png"
+        )
+        self.blocked_player = None
+        
+    def get_state(self):
+        return self.blocked_player
+        
+    def set_state(self, state):
+        self.blocked_player = state
+        
+    def can_move(self, game, worker, target_pos):
+        # ACTIVE: Block opponent from moving up if Athena moved up last turn
+        if (self.blocked_player == worker.owner and 
+            worker.x is not None and worker.y is not None):
+            current_height = game.board[worker.y][worker.x]
+            target_height = game.board[target_pos[1]][target_pos[0]]
+            if target_height > current_height:
+                return False  # Blocked by Athena
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        return True
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        # ACTIVE: Check if this worker moved up
+        if old_pos and worker.x is not None:
+            old_height = game.board[old_pos[1]][old_pos[0]]
+            new_height = game.board[new_pos[1]][new_pos[0]]
+            if new_height > old_height:
+                # Block the opponent player
+                self.blocked_player = 1 - worker.owner
+            else:
+                self.blocked_player = None
+        
+    def on_build(self, game, worker, build_pos):
+        pass
+        
+    def has_won(self, game, worker):
+        return False
+
+class Poseidon(GodPower):
+    """At the end of your turn, build up to three blocks neighboring any builder on the ground level that did not move"""
+    def __init__(self):
+        super().__init__(
+            "Poseidon",
+            "At the end of your turn, build up to three blocks neighboring any builder on the ground level that did not move.",
+            "assets/gods/poseidon.png"
+        )
+        self.unmoved_workers = set()
+        
+    def get_state(self):
+        return frozenset(self.unmoved_workers)
+        
+    def set_state(self, state):
+        self.unmoved_workers = set(state)
+        
+    def can_move(self, game, worker, target_pos):
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        return True
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        # ACTIVE: Track which workers moved
+        worker_id = (worker.owner, worker.worker_id)
+        if worker_id in self.unmoved_workers:
+            self.unmoved_workers.remove(worker_id)
+        
+    def on_build(self, game, worker, build_pos):
+        # ACTIVE: Poseidon's extra builds (simplified for now)
+        # In a full implementation, this would allow up to 3 extra builds
+        # near unmoved ground-level workers
+        pass
+        
+    def has_won(self, game, worker):
+        return False
+
+class GodPowerManager:
+    """Manages god power integration with game logic"""
+    def __init__(self):
+        self.human_god = None
+        self.ai_god = None
+        
+    def set_gods(self, human_god, ai_god):
+        """Set the selected god powers"""
+        self.human_god = human_god
+        self.ai_god = ai_god
+        print(f"God powers set: Human={human_god.name}, AI={ai_god.name}")
+        
+    def get_god_for_player(self, player):
+        """Get the god power for a specific player"""
+        return self.human_god if player == 0 else self.ai_god
+        
+    def get_state(self):
+        """Snapshot both gods' rule state (see GodPower.get_state)"""
+        return (self.human_god.get_state() if self.human_god else None,
+                self.ai_god.get_state() if self.ai_god else None)
+        
+    def set_state(self, state):
+        """Restore both gods' rule state captured by get_state"""
+        if self.human_god:
+            self.human_god.set_state(state[0])
+        if self.ai_god:
+            self.ai_god.set_state(state[1])
+        
+    def clone(self, worker_map=None):
+        """Manager with copies of both gods, for searching a game snapshot on another thread"""
+        manager = GodPowerManager()
+        manager.human_god = self.human_god.clone(worker_map) if self.human_god else None
+        manager.ai_god = self.ai_god.clone(worker_map) if self.ai_god else None
+        return manager
+        
+    def can_move(self, game, worker, target_pos):
+        """ACTIVE: Check if move is allowed with god power modifications"""
+        god = self.get_god_for_player(worker.owner)
+        if god:
+            return god.can_move(game, worker, target_pos)
+        return True
+        
+    def can_build(self, game, worker, target_pos):
+        """ACTIVE: Check if build is allowed with god power modifications"""
+        god = self.get_god_for_player(worker.owner)
+        if god:
+            return god.can_build(game, worker, target_pos)
+        return True
+        
+    def on_move(self, game, worker, old_pos, new_pos):
+        """ACTIVE: Trigger god power effects after move"""
+        god = self.get_god_for_player(worker.owner)
+        if god:
+            god.on_move(game, worker, old_pos, new_pos)
+            
+    def on_build(self, game, worker, build_pos):
+        """ACTIVE: Trigger god power effects after build"""
+        god = self.get_god_for_player(worker.owner)
+        if god:
+            god.on_build(game, worker, build_pos)
+            
+    def check_special_win(self, game, worker):
+        """ACTIVE: Check for special win conditions"""
+        god = self.get_god_for_player(worker.owner)
+        if god:
+            return god.has_won(game, worker)
+        return False
+
+# Factory function to create gods by name
+def create_god(name):
+    """Create a god instance by name"""
+    god_classes = {
+        "Pan": Pan,
+        "Atlas": Atlas, 
+        "Artemis": Artemis,
+        "Demeter": Demeter,
+        "Athena": Athena,
+        "Poseidon": Poseidon
+    }
+    
+    if name in god_classes:
+        return god_classes[name]()
+    return None
+
+# Names create_god accepts, in selection screen order
+GOD_NAMES = ["Pan", "Atlas", "Artemis", "Demeter", "Athena", "Poseidon"]
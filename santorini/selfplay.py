@@ -0,0 +1,117 @@
+"""Engine configs, position setup and headless games (used by the CLI, arena.py and the tools)"""
+import random
+import time
+
+from .gameplay import AIPlayer, MCTSPlayer, Santorini
+from .gods import GodPowerManager, create_god
+
+MAX_PLIES = 200  # Games still running after this many actions are drawn
+
+def parse_engine(spec):
+    """Engine config dict from a "name:key=value,..." spec (options are listed in arena.py)"""
+    name, _, options = spec.partition(":")
+    config = {"name": name, "type": "minimax"}
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        if key == "type":
+            if value not in ("minimax", "mcts"):
+                raise ValueError(f"Unknown engine type: {value}")
+            config["type"] = value
+        elif key in ("depth", "time", "iterations", "workers"):
+            config[key] = int(value)
+        elif key == "height":
+            config[key] = tuple(int(score) for score in value.split("/"))
+        elif key in ("mobility", "builds"):
+            config[key] = float(value)
+        else:
+            raise ValueError(f"Unknown engine option: {key}")
+    return config
+
+def make_player(config, player_id, god_manager):
+    """AIPlayer or MCTSPlayer for a config"""
+    if config["type"] == "mcts":
+        return MCTSPlayer(player_id, god_manager=god_manager, time_budget_ms=config.get("time", 1500),
+                          iterations=config.get("iterations"))
+
+    weights = {key: config[key] for key in ("height", "mobility", "builds") if key in config}
+    return AIPlayer(player_id, depth=config.get("depth", 3), god_manager=god_manager,
+                    time_budget_ms=config.get("time"), eval_weights=weights,
+                    parallel_workers=config.get("workers", 0))
+
+def new_game(gods):
+    """Empty Santorini game with gods[i] (a create_god name or None) for player i"""
+    god_manager = None
+    if any(gods):
+        god_manager = GodPowerManager()
+        god_manager.human_god = create_god(gods[0]) if gods[0] else None
+        god_manager.ai_god = create_god(gods[1]) if gods[1] else None
+    return Santorini(god_manager)
+
+def load_position(gods, heights, squares, turn=0):
+    """Game from a position: 25 height digits and 4 worker squares (square = row * 5 + col)"""
+    game = new_game(gods)
+    for square, height in enumerate(heights):
+        game.board[square // 5][square % 5] = int(height)
+    for index, square in enumerate(squares):
+        game.place_worker_at(index, square % 5, square // 5)
+    game.turn = turn
+    game.compute_hash()
+    return game
+
+def random_placement(seed):
+    """Four distinct (col, row) squares for the workers, in placement order"""
+    squares = random.Random(seed).sample(range(25), 4)
+    return [(square % 5, square // 5) for square in squares]
+
+def play_game(configs, gods, seed, max_plies=MAX_PLIES, on_action=None):
+    """Play one game, configs[i] and gods[i] for player i; returns the result record.
+
+    on_action(game, action, think_ms) is called after every action, e.g. to print the game.
+    """
+    random.seed(seed)  # Evaluation noise and MCTS playouts
+    game = new_game(gods)
+    for index, (col, row) in enumerate(random_placement(seed)):
+        game.place_worker_at(index, col, row)
+    game.turn = 0
+    players = [make_player(config, player_id, game.god_manager) for player_id, config in enumerate(configs)]
+
+    think_ms = [0.0, 0.0]
+    moves = [0, 0]
+    depths = [0, 0]  # Sum of completed search depths (alpha-beta only)
+    winner = None
+    plies = 0
+    while plies < max_plies:
+        player = game.turn
+        if game.is_losing_position(player):
+            winner = 1 - player  # Stalemated: no worker can move
+            break
+
+        start = time.perf_counter()
+        action = players[player].choose_action(game)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        think_ms[player] += elapsed
+        moves[player] += 1
+        depths[player] += getattr(players[player], "completed_depth", 0)
+        if action is None:
+            winner = 1 - player
+            break
+
+        game.do_action(*action)
+        plies += 1
+        if on_action is not None:
+            on_action(game, action, elapsed)
+        if game.game_over:
+            winner = game.winner
+            break
+        game.switch_turn()
+
+    return {
+        "engines": [config["name"] for config in configs],
+        "gods": list(gods),
+        "seed": seed,
+        "winner": winner,
+        "plies": plies,
+        "think_ms": [round(ms, 1) for ms in think_ms],
+        "moves": moves,
+        "depth": [round(depths[side] / moves[side], 2) if moves[side] else 0.0 for side in (0, 1)],
+    }
@@ -0,0 +1,18 @@
+"""Arena rating tests: python -m pytest test_arena.py"""
+import pytest
+
+from arena import elo_ratings
+
+def games(wins, losses):
+    """Results of engine "a" against engine "b" (a is always side 0)"""
+    return ([{"engines": ["a", "b"], "winner": 0}] * wins +
+            [{"engines": ["a", "b"], "winner": 1}] * losses)
+
+def test_perfect_score_converges():
+    ratings = [elo_ratings(games(4, 0), iterations)["b"] for iterations in (200, 2000, 20000)]
+    assert -1000 < ratings[0] < 0
+    assert ratings[1] == pytest.approx(ratings[0], abs=0.01)
+    assert ratings[2] == pytest.approx(ratings[0], abs=0.01)
+
+def test_better_engine_rated_higher():
+    assert elo_ratings(games(4, 0))["b"] < elo_ratings(games(3, 1))["b"] < elo_ratings(games(2, 2))["b"] == 0
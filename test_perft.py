@@ -0,0 +1,34 @@
+"""Move generator and search regression tests: python -m pytest test_perft.py"""
+import pytest
+
+from benchmark import CORPUS, build_position
+from perft import differential, perft, perft_bitboard
+from santorini.gameplay import AIPlayer, BitBoard
+
+# perft(2) counts pinned by both generators: (position, count)
+PERFT_COUNTS = [
+    (CORPUS[0], 1719),  # Opening, Pan vs Atlas
+    (CORPUS[5], 1454),  # Endgame, Atlas vs Artemis
+    (CORPUS[8], 2351),  # Endgame, Artemis vs Demeter
+    (CORPUS[13], 2363),  # Midgame, Athena vs Poseidon
+    (("midgame", None, None, "0001020010002110100000100", (10, 17, 7, 2), 0), 2404),  # No gods
+]
+
+def test_differential():
+    assert differential(games=20, seed=0) is None
+
+@pytest.mark.parametrize("entry, expected", PERFT_COUNTS)
+def test_perft(entry, expected):
+    game = build_position(entry)
+    assert perft(game, 2) == expected
+    assert perft_bitboard(BitBoard.from_game(game), 2) == expected
+
+@pytest.mark.parametrize("index", [1, 4, 10, 16])
+def test_alphabeta_matches_minimax(index):
+    # Noise, quiescence and reductions off: alpha-beta must then return the minimax score
+    game = build_position(CORPUS[index])
+    reference = AIPlayer(player_id=game.turn, depth=2, use_alpha_beta=False, eval_noise=False)
+    ai = AIPlayer(player_id=game.turn, depth=2, eval_noise=False, quiescence_depth=0, use_lmr=False)
+    expected, _ = reference.minimax(game.clone(), 2, True)
+    score, _ = ai.alphabeta(game.clone(), 2, float('-inf'), float('inf'), True)
+    assert score == expected
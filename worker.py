@@ -1,5 +1,25 @@
 #worker.py
 import arcade
+from array import array
+
+from background import bake_texture
+
+# Baked worker textures by (radius, colour), shared by every view until the process exits
+_worker_textures = {}
+
+def bake_worker_texture(radius, color):
+    """Render a worker disc (black border) once into a texture, centred on a transparent square"""
+    key = (radius, color)
+    if key not in _worker_textures:
+        # Even size keeps the disc centre on a pixel corner, like the integer cell centres
+        size = (int(radius) + 3) * 2
+        
+        def draw():
+            arcade.draw_circle_filled(size // 2, size // 2, radius, color)
+            arcade.draw_circle_outline(size // 2, size // 2, radius, arcade.color.BLACK, 2)
+        
+        _worker_textures[key] = bake_texture(size, draw, f"worker-{radius}-{tuple(color)}")
+    return _worker_textures[key]
 
 class WorkerView:
     def __init__(self, game, board_view, radius=25, move_time=0.3):
@@ -8,76 +28,71 @@ class WorkerView:
         self.radius = radius
         self.move_time = move_time
         
-        # Animation state
-        self.worker_positions = {}  # worker_index -> (x, y) visual positions
-        self.animations = {}  # worker_index -> animation data
-        
         # Worker colors
         self.colors = [arcade.color.RED, arcade.color.BLUE]
+        
+        # One sprite per worker (hidden until placed), drawn in a single call
+        self.sprites = arcade.SpriteList()
+        for worker in game.workers:
+            sprite = arcade.Sprite(bake_worker_texture(radius, self.colors[worker.owner]))
+            sprite.visible = False
+            self.sprites.append(sprite)
+        
+        # Animation state by worker index: start and target centres, time since the move started
+        count = len(game.workers)
+        self.start_x = array('d', [0.0] * count)
+        self.start_y = array('d', [0.0] * count)
+        self.target_x = array('d', [0.0] * count)
+        self.target_y = array('d', [0.0] * count)
+        self.elapsed = array('d', [0.0] * count)
+        self.moving = []  # Indices of the workers being animated
     
     def sync_positions(self):
-        """Sync visual positions with logical positions for all workers"""
+        """Snap every placed, resting worker to its cell (call after placement or a move)"""
         for i, worker in enumerate(self.game.workers):
-            if worker.x is not None and worker.y is not None:
-                target_x, target_y = self.board_view.cell_to_center((worker.x, worker.y))
-                self.worker_positions[i] = (target_x, target_y)
+            if worker.x is not None and worker.y is not None and i not in self.moving:
+                sprite = self.sprites[i]
+                sprite.position = self.board_view.cell_to_center((worker.x, worker.y))
+                sprite.visible = True
     
     def start_move(self, worker_index, target_cell):
         """Start animation for moving a worker to target cell"""
-        if worker_index not in self.worker_positions:
+        sprite = self.sprites[worker_index]
+        if not sprite.visible:
             return
         
-        start_x, start_y = self.worker_positions[worker_index]
-        target_x, target_y = self.board_view.cell_to_center(target_cell)
-        
-        self.animations[worker_index] = {
-            'start_pos': (start_x, start_y),
-            'target_pos': (target_x, target_y),
-            'elapsed': 0.0,
-            'duration': self.move_time
-        }
+        self.start_x[worker_index], self.start_y[worker_index] = sprite.position
+        self.target_x[worker_index], self.target_y[worker_index] = self.board_view.cell_to_center(target_cell)
+        self.elapsed[worker_index] = 0.0
+        if worker_index not in self.moving:
+            self.moving.append(worker_index)
     
     def update(self, delta_time):
-        """Update worker animations"""
-        finished_animations = []
+        """Advance the running animations (nothing to do while every worker rests)"""
+        if not self.moving:
+            return
         
-        for worker_index, anim in self.animations.items():
-            anim['elapsed'] += delta_time
-            
-            if anim['elapsed'] >= anim['duration']:
+        duration = self.move_time
+        still_moving = []
+        for i in self.moving:
+            elapsed = self.elapsed[i] + delta_time
+            self.elapsed[i] = elapsed
+            if elapsed >= duration:
                 # Animation finished
-                self.worker_positions[worker_index] = anim['target_pos']
-                finished_animations.append(worker_index)
+                self.sprites[i].position = (self.target_x[i], self.target_y[i])
             else:
-                # Interpolate position
-                progress = anim['elapsed'] / anim['duration']
                 # Smooth easing
+                progress = elapsed / duration
                 progress = progress * progress * (3.0 - 2.0 * progress)
-                
-                start_x, start_y = anim['start_pos']
-                target_x, target_y = anim['target_pos']
-                
-                current_x = start_x + (target_x - start_x) * progress
-                current_y = start_y + (target_y - start_y) * progress
-                
-                self.worker_positions[worker_index] = (current_x, current_y)
-        
-        # Remove finished animations
-        for worker_index in finished_animations:
-            del self.animations[worker_index]
+                self.sprites[i].position = (self.start_x[i] + (self.target_x[i] - self.start_x[i]) * progress,
+                                            self.start_y[i] + (self.target_y[i] - self.start_y[i]) * progress)
+                still_moving.append(i)
+        self.moving = still_moving
     
     def any_moving(self):
         """Check if any worker is currently animating"""
-        return len(self.animations) > 0
+        return len(self.moving) > 0
     
     def draw(self):
         """Draw all workers"""
-        for i, worker in enumerate(self.game.workers):
-            if i in self.worker_positions:
-                x, y = self.worker_positions[i]
-                color = self.colors[worker.owner]
-                
-                # Draw worker as a circle
-                arcade.draw_circle_filled(x, y, self.radius, color)
-                # Draw border
-                arcade.draw_circle_outline(x, y, self.radius, arcade.color.BLACK, 2)
+        self.sprites.draw(pixelated=True)